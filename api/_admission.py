@@ -0,0 +1,54 @@
+import threading
+
+
+class AdmissionGate:
+    """
+    Admission control for CPU-heavy requests: up to `concurrency` run at
+    once and up to `queue` more wait for a slot. Anything beyond that is
+    rejected at once, so a load spike is shed with 429s instead of piling
+    up behind the worker pool and inflating every request's latency.
+    """
+
+    def __init__(self, concurrency, queue):
+        self.concurrency = max(1, int(concurrency))
+        self.queue = max(0, int(queue))
+        self.running = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, timeout=None):
+        """Takes a slot, waiting at most timeout seconds; False if refused."""
+        with self._cond:
+            if self.running >= self.concurrency:
+                if self.waiting >= self.queue:
+                    self.rejected += 1
+                    return False
+                self.waiting += 1
+                try:
+                    free = self._cond.wait_for(lambda: self.running < self.concurrency, timeout)
+                finally:
+                    self.waiting -= 1
+                if not free:
+                    self.rejected += 1
+                    return False
+            self.running += 1
+            self.admitted += 1
+            return True
+
+    def release(self):
+        with self._cond:
+            self.running -= 1
+            self._cond.notify()
+
+    def stats(self):
+        with self._cond:
+            return {
+                "concurrency": self.concurrency,
+                "queue": self.queue,
+                "running": self.running,
+                "waiting": self.waiting,
+                "admitted": self.admitted,
+                "rejected": self.rejected,
+            }
@@ -0,0 +1,175 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+
+def canonical_key(processes, **params):
+    """
+    Content hash of a scheduling request.
+    Numeric fields are coerced to float so 1 and 1.0 share an entry; pids
+    are kept as sent because responses echo them. Process order is kept
+    because it decides tie-breaks.
+    """
+    def norm(value):
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, (int, float)):
+            return float(value)
+        if isinstance(value, dict):
+            return {str(k): v if k == "pid" else norm(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [norm(v) for v in value]
+        return value
+
+    material = {"processes": norm(processes), "params": norm(params)}
+    payload = json.dumps(material, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    LRU cache of JSON-serializable results, bounded by entry count and by
+    encoded size, with an optional on-disk tier that survives restarts.
+    """
+
+    def __init__(self, max_entries=128, max_bytes=64 * 1024 * 1024, disk_dir=None, disk_entries=1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.disk_entries = disk_entries
+
+        self._entries = OrderedDict()   # key -> (value, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._disk_count = 0
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            self._disk_count = len(self._disk_files())
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            max_entries=int(os.environ.get("SCHEDULE_CACHE_SIZE", 128)),
+            max_bytes=int(os.environ.get("SCHEDULE_CACHE_MAX_BYTES", 64 * 1024 * 1024)),
+            disk_dir=os.environ.get("SCHEDULE_CACHE_DIR") or None,
+            disk_entries=int(os.environ.get("SCHEDULE_CACHE_DISK_ENTRIES", 1024)),
+        )
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+
+        value, size = self._disk_get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._store(key, value, size)
+        return value
+
+    def put(self, key, value, size=None):
+        """
+        Stores value. Pass size, the length of the response body already
+        encoded from it, to spare encoding it again; JSON is only produced
+        when the disk tier needs it or size is unknown.
+        """
+        if self.max_entries <= 0 and not self.disk_dir:
+            return
+        encoded = json.dumps(value) if self.disk_dir or size is None else None
+        with self._lock:
+            self._store(key, value, len(encoded) if size is None else size)
+        if encoded is not None:
+            self._disk_put(key, encoded)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            }
+
+    # -----------------------------
+    #   Memory tier (lock held)
+    # -----------------------------
+    def _store(self, key, value, size):
+        if size > self.max_bytes or self.max_entries <= 0:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old[1]
+        self._entries[key] = (value, size)
+        self._bytes += size
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            self.evictions += 1
+
+    # -----------------------------
+    #   Disk tier
+    # -----------------------------
+    def _path(self, key):
+        return os.path.join(self.disk_dir, f"{key}.json")
+
+    def _disk_files(self):
+        return [f for f in os.listdir(self.disk_dir) if f.endswith(".json")]
+
+    def _disk_get(self, key):
+        if not self.disk_dir:
+            return None, 0
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                encoded = f.read()
+            value = json.loads(encoded)
+            os.utime(self._path(key))
+            return value, len(encoded)
+        except (OSError, ValueError):
+            return None, 0
+
+    def _disk_put(self, key, encoded):
+        if not self.disk_dir:
+            return
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            existed = os.path.exists(path)
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(encoded)
+            os.replace(tmp, path)
+            if not existed:
+                self._disk_count += 1
+            if self._disk_count > self.disk_entries:
+                self._disk_prune()
+        except OSError:
+            pass
+
+    def _disk_prune(self):
+        # Drop the least recently used files (reads touch mtime)
+        files = [os.path.join(self.disk_dir, f) for f in self._disk_files()]
+        files.sort(key=os.path.getmtime)
+        excess = len(files) - self.disk_entries
+        for path in files[:max(excess, 0)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._disk_count = min(len(files), self.disk_entries)
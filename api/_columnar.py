@@ -0,0 +1,147 @@
+"""
+Columnar binary encoding of API payloads, plus response compression.
+
+Layout (little-endian):
+    b"SCHD" | u32 version | u32 metadata length | metadata JSON | data
+
+The metadata is the usual JSON payload, except that every "schedule" list
+of (pid, start, end) segments becomes
+    {"$columns": {"length": n, "pids": [...], "pid": [offset, "u16"],
+                  "start": [offset, "f64"], "end": [offset, "f64"]}}
+(pid indexes into pids, as u8, u16 or i32 depending on len(pids)) and every base64 "gantt_image" becomes
+    {"$bytes": [offset, length]}
+with the raw image bytes. Offsets are relative to the data section, which
+starts (like every buffer in it) on an 8-byte boundary, so browsers can
+view the columns as typed arrays without copying.
+"""
+import base64
+import gzip
+import json
+import struct
+import sys
+import zlib
+from array import array
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MIMETYPE = "application/x-schedule-columnar"
+MAGIC = b"SCHD"
+VERSION = 1
+
+COMPRESSIBLE = ("application/json", "image/svg+xml", MIMETYPE)
+MIN_COMPRESS_BYTES = 1024
+
+# Narrowest pid index column for a given pid table size
+_INDEX_TYPES = (("B", "u8", 1 << 8), ("H", "u16", 1 << 16), ("i", "i32", float("inf")))
+
+
+class _Buffers:
+    def __init__(self):
+        self.chunks = []
+        self.size = 0
+
+    def add(self, data):
+        offset = self.size
+        self.chunks.append(data)
+        self.size += len(data)
+        pad = -self.size % 8
+        if pad:
+            self.chunks.append(b"\0" * pad)
+            self.size += pad
+        return offset
+
+    def add_array(self, arr):
+        if sys.byteorder != "little":
+            arr.byteswap()
+        return self.add(arr.tobytes())
+
+
+def _columns(segments, buffers):
+    index = {}
+    pids = []
+    pid_idx = array("i")
+    start = array("d")
+    end = array("d")
+    for pid, s, e in segments:
+        idx = index.get(pid)
+        if idx is None:
+            idx = index[pid] = len(pids)
+            pids.append(pid)
+        pid_idx.append(idx)
+        start.append(s)
+        end.append(e)
+    for code, kind, limit in _INDEX_TYPES:
+        if len(pids) <= limit:
+            pid_idx = array(code, pid_idx)
+            break
+    return {"$columns": {
+        "length": len(pid_idx),
+        "pids": pids,
+        "pid": [buffers.add_array(pid_idx), kind],
+        "start": [buffers.add_array(start), "f64"],
+        "end": [buffers.add_array(end), "f64"],
+    }}
+
+
+def _walk(obj, buffers):
+    if isinstance(obj, dict):
+        out = {}
+        for key, value in obj.items():
+            if key == "schedule" and isinstance(value, (list, tuple)):
+                out[key] = _columns(value, buffers)
+            elif key == "gantt_image" and isinstance(value, str):
+                raw = base64.b64decode(value)
+                out[key] = {"$bytes": [buffers.add(raw), len(raw)]}
+            else:
+                out[key] = _walk(value, buffers)
+        return out
+    if isinstance(obj, (list, tuple)):
+        return [_walk(value, buffers) for value in obj]
+    return obj
+
+
+def encode(payload):
+    """Encodes a JSON-ready payload in the columnar layout above."""
+    buffers = _Buffers()
+    meta = json.dumps(_walk(payload, buffers), separators=(",", ":")).encode("utf-8")
+    head = MAGIC + struct.pack("<II", VERSION, len(meta)) + meta
+    head += b"\0" * (-len(head) % 8)
+    return b"".join([head] + buffers.chunks)
+
+
+def accepts_columnar(accept_header, fmt=None):
+    """True when ?format=columnar or the Accept header lists MIMETYPE."""
+    if fmt:
+        return fmt == "columnar"
+    return MIMETYPE in (accept_header or "")
+
+
+def compress(response, accept_encoding):
+    """
+    Compresses a buffered JSON, SVG or columnar response with brotli (when
+    installed), gzip or deflate per Accept-Encoding. Streams, small bodies,
+    PNGs and responses that are already encoded pass through untouched.
+    """
+    if (response.direct_passthrough or response.is_streamed or response.status_code != 200
+            or "Content-Encoding" in response.headers or response.mimetype not in COMPRESSIBLE):
+        return response
+    response.vary.add("Accept-Encoding")
+    body = response.get_data()
+    if len(body) < MIN_COMPRESS_BYTES:
+        return response
+
+    accepted = {token.split(";")[0].strip().lower() for token in (accept_encoding or "").split(",")}
+    if brotli is not None and "br" in accepted:
+        encoded, encoding = brotli.compress(body, quality=5), "br"
+    elif "gzip" in accepted:
+        encoded, encoding = gzip.compress(body, compresslevel=5, mtime=0), "gzip"
+    elif "deflate" in accepted:
+        encoded, encoding = zlib.compress(body, 5), "deflate"
+    else:
+        return response
+    response.set_data(encoded)
+    response.headers["Content-Encoding"] = encoding
+    return response
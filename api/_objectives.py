@@ -0,0 +1,120 @@
+"""
+Best-algorithm selection over the summary metrics every scheduler reports.
+
+A weighted objective min-max normalizes each metric across the compared
+algorithms (0 = best, 1 = worst, whatever its direction) and ranks them by
+the weighted mean, so weights are scale-free. The Pareto front lists every
+algorithm that no other one beats on all of the given metrics at once.
+"""
+
+# metric -> True when larger is better
+METRIC_GOALS = {
+    "avg_waiting_time": False,
+    "avg_turnaround_time": False,
+    "avg_response_time": False,
+    "p95_waiting_time": False,
+    "p99_waiting_time": False,
+    "context_switches": False,
+    "switch_overhead_time": False,
+    "makespan": False,
+    "throughput": True,
+    "cpu_utilization": True,
+    "fairness_index": True,
+}
+DEFAULT_OBJECTIVE = {"avg_waiting_time": 1.0}
+PARETO_METRICS = ("avg_waiting_time", "avg_response_time", "throughput", "cpu_utilization", "fairness_index")
+
+
+def _check_metric(name):
+    if name not in METRIC_GOALS:
+        raise ValueError(f"Unknown metric: {name} (expected one of {', '.join(METRIC_GOALS)})")
+    return name
+
+
+def parse_objective(value):
+    """
+    Accepts a metric name or a {metric: weight} mapping of non-negative
+    weights; returns the mapping. Empty means DEFAULT_OBJECTIVE.
+    """
+    if not value:
+        return dict(DEFAULT_OBJECTIVE)
+    if isinstance(value, str):
+        return {_check_metric(value.strip()): 1.0}
+    if not isinstance(value, dict):
+        raise ValueError("objective must be a metric name or a {metric: weight} object")
+    weights = {}
+    for name, weight in value.items():
+        try:
+            weight = float(weight)
+        except (TypeError, ValueError):
+            raise ValueError(f"weight for {name} must be a number")
+        if weight < 0:
+            raise ValueError(f"weight for {name} must be non-negative")
+        if weight > 0:
+            weights[_check_metric(str(name))] = weight
+    if not weights:
+        raise ValueError("objective needs at least one positive weight")
+    return weights
+
+
+def parse_pareto_metrics(value):
+    """A list or comma-separated string of metrics; empty means PARETO_METRICS."""
+    if not value:
+        return list(PARETO_METRICS)
+    if isinstance(value, str):
+        value = value.split(",")
+    return [_check_metric(str(name).strip()) for name in value]
+
+
+def _costs(metrics, name):
+    """Per-algorithm normalized cost of one metric; a missing value is worst."""
+    values = {algo: summary.get(name) for algo, summary in metrics.items()}
+    present = [v for v in values.values() if v is not None]
+    lo, hi = (min(present), max(present)) if present else (0.0, 0.0)
+    span = hi - lo
+    costs = {}
+    for algo, v in values.items():
+        if v is None:
+            costs[algo] = 1.0
+        elif span <= 0:
+            costs[algo] = 0.0
+        else:
+            costs[algo] = (hi - v) / span if METRIC_GOALS[name] else (v - lo) / span
+    return costs
+
+
+def weighted_scores(metrics, weights):
+    """{algorithm: score in [0, 1]}, lower is better."""
+    scores = {algo: 0.0 for algo in metrics}
+    total = sum(weights.values())
+    for name, weight in weights.items():
+        for algo, cost in _costs(metrics, name).items():
+            scores[algo] += weight * cost / total
+    return scores
+
+
+def select_best(metrics, weights):
+    """
+    Returns (best algorithm, scores). Ties keep the first algorithm in
+    request order, so a single-metric objective matches a plain min().
+    """
+    scores = weighted_scores(metrics, weights)
+    return min(scores, key=scores.get), scores
+
+
+def pareto_front(metrics, names=PARETO_METRICS):
+    """Algorithms not dominated on names, in request order."""
+    def oriented(summary):
+        return [summary.get(n, float("-inf") if METRIC_GOALS[n] else float("inf")) * (-1 if METRIC_GOALS[n] else 1)
+                for n in names]
+
+    points = {algo: oriented(summary) for algo, summary in metrics.items()}
+    front = []
+    for algo, p in points.items():
+        dominated = any(
+            all(a <= b for a, b in zip(q, p)) and any(a < b for a, b in zip(q, p))
+            for other, q in points.items() if other != algo
+        )
+        if not dominated:
+            front.append(algo)
+    return front
@@ -0,0 +1,189 @@
+"""
+Request instrumentation: per-phase wall/CPU timings, Prometheus-style
+counters and an opt-in sampling profiler.
+
+Phases collects (phase, algorithm, wall, cpu) entries for one request;
+pool workers fill their own and ship the plain entries back. Registry
+aggregates them across requests for /api/metrics (per process, so every
+server worker reports its own numbers).
+"""
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+import bisect
+import sys
+import threading
+import time
+
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Phases:
+    """Timings of one request (or of one pool task) in the order they ran."""
+
+    def __init__(self):
+        self.entries = []
+
+    @contextmanager
+    def phase(self, name, algorithm=None):
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            self.entries.append((name, algorithm, time.perf_counter() - wall, time.thread_time() - cpu))
+
+    def extend(self, entries):
+        self.entries.extend(tuple(entry) for entry in entries)
+
+    def server_timing(self):
+        """Server-Timing header value; durations are in milliseconds."""
+        metrics = []
+        for name, algorithm, wall, cpu in self.entries:
+            label = f"{name}.{algorithm}" if algorithm else name
+            metrics.append(f'{label};dur={wall * 1000:.3f};desc="cpu {cpu * 1000:.3f}ms"')
+        return ", ".join(metrics)
+
+
+def _labels(**labels):
+    inner = ",".join(f'{k}="{str(v)}"' for k, v in labels.items() if v is not None)
+    return "{" + inner + "}" if inner else ""
+
+
+class Registry:
+    """Thread-safe totals behind /api/metrics."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._phases = {}           # (phase, algorithm) -> [calls, wall, cpu]
+        self._counts = Counter()    # (name, algorithm) -> total
+        self._requests = Counter()  # (endpoint, method, status) -> count
+        self._durations = {}        # endpoint -> [bucket counts..., count, sum]
+
+    def record(self, entries):
+        with self._lock:
+            for name, algorithm, wall, cpu in entries:
+                totals = self._phases.setdefault((name, algorithm), [0, 0.0, 0.0])
+                totals[0] += 1
+                totals[1] += wall
+                totals[2] += cpu
+
+    def count(self, name, algorithm, value):
+        with self._lock:
+            self._counts[(name, algorithm)] += value
+
+    def observe_request(self, endpoint, method, status, seconds):
+        with self._lock:
+            self._requests[(endpoint, method, status)] += 1
+            hist = self._durations.setdefault(endpoint, [0] * (len(REQUEST_BUCKETS) + 2))
+            hist[bisect.bisect_left(REQUEST_BUCKETS, seconds)] += 1
+            hist[-1] += seconds
+
+    def render(self, gauges=()):
+        """
+        Prometheus text exposition. gauges are extra (name, help, {labels
+        tuple: value}) samples such as cache and admission state.
+        """
+        with self._lock:
+            phases = sorted(self._phases.items(), key=lambda kv: (kv[0][0], kv[0][1] or ""))
+            counts = sorted(self._counts.items(), key=lambda kv: (kv[0][0], kv[0][1] or ""))
+            requests = sorted(self._requests.items())
+            durations = sorted((k, list(v)) for k, v in self._durations.items())
+
+        lines = []
+
+        def header(name, kind, text):
+            lines.append(f"# HELP {name} {text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        for metric, index, text in (
+            ("scheduler_phase_calls_total", 0, "Times each request phase ran."),
+            ("scheduler_phase_seconds_total", 1, "Wall time spent in each request phase."),
+            ("scheduler_phase_cpu_seconds_total", 2, "CPU time spent in each request phase."),
+        ):
+            header(metric, "counter", text)
+            for (name, algorithm), totals in phases:
+                lines.append(f"{metric}{_labels(phase=name, algorithm=algorithm)} {totals[index]}")
+
+        for name in sorted({name for (name, _), _ in counts}):
+            metric = f"scheduler_{name}_total"
+            header(metric, "counter", f"Simulated {name.replace('_', ' ')}.")
+            for (n, algorithm), value in counts:
+                if n == name:
+                    lines.append(f"{metric}{_labels(algorithm=algorithm)} {value}")
+
+        header("scheduler_requests_total", "counter", "Requests by endpoint, method and status.")
+        for (endpoint, method, status), value in requests:
+            lines.append(f"scheduler_requests_total{_labels(endpoint=endpoint, method=method, status=status)} {value}")
+
+        metric = "scheduler_request_duration_seconds"
+        header(metric, "histogram", "Request wall time until the response is ready.")
+        for endpoint, hist in durations:
+            cumulative = 0
+            for bound, value in zip(REQUEST_BUCKETS + ("+Inf",), hist):
+                cumulative += value
+                lines.append(f"{metric}_bucket{_labels(endpoint=endpoint, le=bound)} {cumulative}")
+            lines.append(f"{metric}_count{_labels(endpoint=endpoint)} {cumulative}")
+            lines.append(f"{metric}_sum{_labels(endpoint=endpoint)} {hist[-1]}")
+
+        for name, text, samples in gauges:
+            header(name, "gauge", text)
+            for labels, value in samples.items():
+                lines.append(f"{name}{_labels(**dict(labels))} {value}")
+        return "\n".join(lines) + "\n"
+
+
+class SamplingProfiler:
+    """
+    Samples one thread's stack every interval seconds from a background
+    thread and counts collapsed stacks ("outer;...;inner count" lines, the
+    input format of flamegraph.pl and speedscope). Work shipped to pool
+    workers shows up as time waiting on futures; the phase timings cover it.
+    """
+
+    def __init__(self, thread_id, interval=0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        return self.stacks
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_filename.rsplit('/', 1)[-1]}:{code.co_name}")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def dump(self):
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+class ProfileStore:
+    """The last `size` slow-request profiles, by id."""
+
+    def __init__(self, size):
+        self.size = size
+        self._profiles = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, profile_id, text):
+        with self._lock:
+            self._profiles[profile_id] = text
+            while len(self._profiles) > self.size:
+                self._profiles.popitem(last=False)
+
+    def get(self, profile_id):
+        with self._lock:
+            return self._profiles.get(profile_id)
@@ -1,8 +1,21 @@
-from flask import Flask, request, jsonify, send_from_directory
+from flask import (Flask, Response, request, jsonify, send_from_directory, g, has_request_context,
+                   stream_with_context)
 from flask_cors import CORS
+from werkzeug.exceptions import HTTPException, RequestEntityTooLarge
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from functools import wraps
 import sys
 import os
+import base64
+import hashlib
+import json
+import math
+import threading
+import time
 import traceback
+import uuid
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -12,17 +25,109 @@ FRONTEND_FOLDER = os.path.join(
 )
 
 try:
-    from schedulers.priority import priority_scheduling, generate_priority_gantt
-    from schedulers.fcfs import fcfs, generate_fcfs_gantt
-    from schedulers.rr import round_robin, generate_gantt_image
-    from schedulers.sjf import sjf, generate_sjf_gantt
-    from schedulers.srtf import srtf, generate_srtf_gantt
+    from schedulers.priority import priority_scheduling
+    from schedulers.fcfs import fcfs
+    from schedulers.rr import round_robin, rr_sweep, normalize_processes
+    from schedulers.sjf import sjf
+    from schedulers.srtf import srtf
+    from schedulers.mlfq import mlfq
+    from schedulers.smp import smp_schedule, POLICIES as SMP_POLICIES, QUEUE_MODES
+    from schedulers.io_bursts import io_schedule, POLICIES as IO_POLICIES
+    from schedulers.online import OnlineScheduler
+    # Renderers import matplotlib lazily, on the first chart request
+    from schedulers.gantt import (
+        generate_fcfs_gantt, generate_sjf_gantt, generate_srtf_gantt,
+        generate_priority_gantt, generate_gantt_image, generate_mlfq_gantt
+    )
+
+    # name -> (simulate, render); every entry is a module-level function so
+    # the pair can be shipped to pool workers.
+    ALGORITHMS = {
+        "FCFS": (fcfs, generate_fcfs_gantt),
+        "SJF": (sjf, generate_sjf_gantt),
+        "SRTF": (srtf, generate_srtf_gantt),
+        "PRIORITY": (priority_scheduling, generate_priority_gantt),
+        "RR": (round_robin, generate_gantt_image),
+        "MLFQ": (mlfq, generate_mlfq_gantt),
+    }
+    # Algorithms whose simulate() takes the request's time quantum
+    QUANTUM_ALGORITHMS = ("RR", "MLFQ")
+    # Optional request fields passed to simulate() as keyword arguments
+    SWITCH_OPTIONS = ("switch_cost", "cache_penalty")
+    ALGORITHM_OPTIONS = {
+        "FCFS": SWITCH_OPTIONS,
+        "SJF": SWITCH_OPTIONS,
+        "SRTF": SWITCH_OPTIONS,
+        "PRIORITY": ("aging_rate", "starvation_threshold") + SWITCH_OPTIONS,
+        "RR": SWITCH_OPTIONS,
+        "MLFQ": SWITCH_OPTIONS,
+    }
+    # The subset the SMP and online engines take
+    ENGINE_OPTIONS = ("aging_rate",) + SWITCH_OPTIONS
 except ImportError as e:
     print(f"Import Error: {e}")
 
+from api._cache import ResultCache, canonical_key
+from api._objectives import parse_objective, parse_pareto_metrics, pareto_front, select_best
+from api._admission import AdmissionGate
+from api import _columnar as columnar
+from api._telemetry import Phases, Registry, SamplingProfiler, ProfileStore
+
 app = Flask(__name__)
 CORS(app)
 
+MAX_WORKERS = int(os.environ.get("SCHEDULER_WORKERS", os.cpu_count() or 1))
+_pool = None
+
+# Backpressure: request size caps, a bounded admission queue in front of the
+# worker pool (429 when full) and a per-request deadline (504 when missed).
+# The deadline covers time spent queued and work on the pool; a request that
+# misses it keeps its slot until its already-running pool tasks finish.
+# Inline fallback work (single-CPU hosts, no process pools) cannot be
+# interrupted.
+MAX_REQUEST_BYTES = int(os.environ.get("MAX_REQUEST_BYTES", 16 * 1024 * 1024))
+MAX_PROCESSES = int(os.environ.get("MAX_PROCESSES", 1_000_000))
+REQUEST_TIMEOUT = float(os.environ.get("REQUEST_TIMEOUT", 30))
+admission = AdmissionGate(
+    int(os.environ.get("MAX_CONCURRENT_REQUESTS", MAX_WORKERS)),
+    int(os.environ.get("MAX_QUEUED_REQUESTS", 2 * MAX_WORKERS)),
+)
+app.config["MAX_CONTENT_LENGTH"] = MAX_REQUEST_BYTES
+
+RENDER_MODES = ("none", "svg", "png")
+CHART_MIMETYPES = {"png": "image/png", "svg": "image/svg+xml"}
+
+# chart_id -> (algorithm, schedule, quantum, size) for lazy /api/chart
+# requests, bounded by entry count and by an estimate of the memory held
+CHART_STORE_SIZE = int(os.environ.get("CHART_STORE_SIZE", 256))
+CHART_STORE_MAX_BYTES = int(os.environ.get("CHART_STORE_MAX_BYTES", 64 * 1024 * 1024))
+CHART_SEGMENT_BYTES = 150   # one [pid, start, end] list with its floats
+_charts = OrderedDict()
+_charts_bytes = 0
+_charts_lock = threading.Lock()
+
+# session_id -> (lock, OnlineScheduler) for the online simulation endpoints.
+# Sessions live in this process only, so on serverless hosts they last as
+# long as the warm instance that created them.
+MAX_SESSIONS = int(os.environ.get("MAX_SESSIONS", 256))
+_sessions = OrderedDict()
+_sessions_lock = threading.Lock()
+
+MAX_BATCH_WORKLOADS = int(os.environ.get("MAX_BATCH_WORKLOADS", 10000))
+MAX_SMP_CPUS = int(os.environ.get("MAX_SMP_CPUS", 1024))
+SWEEP_OBJECTIVES = ("avg_waiting_time", "avg_turnaround_time", "avg_response_time", "p95_waiting_time")
+
+# Whole /api/schedule responses, keyed by a canonical hash of the request
+result_cache = ResultCache.from_env()
+
+# Instrumentation: per-phase timings (Server-Timing, /api/metrics) and, when
+# PROFILE_SLOW_MS is set, a sampling profile of every heavy request slower
+# than that, kept for /api/profiles/<id>
+telemetry = Registry()
+PROFILE_SLOW_MS = float(os.environ["PROFILE_SLOW_MS"]) if os.environ.get("PROFILE_SLOW_MS") else None
+PROFILE_INTERVAL = float(os.environ.get("PROFILE_INTERVAL_MS", 5)) / 1000
+profiles = ProfileStore(int(os.environ.get("PROFILE_STORE_SIZE", 32)))
+
 
 def safe_float(x, default=0.0):
     try:
@@ -31,10 +136,498 @@ def safe_float(x, default=0.0):
         return default
 
 def normalize_stats(stats_dict):
-    clean = {}
-    for k, v in stats_dict.items():
-        clean[str(k)] = safe_float(v) 
-    return clean
+    # Stats carries per-process rows too; only the summary goes in payloads
+    summary = getattr(stats_dict, "summary", stats_dict)
+    return {str(k): safe_float(v) for k, v in summary.items()}
+
+
+def parse_algorithms(value):
+    """
+    Accepts a list or comma-separated string of algorithm names.
+    Returns them upper-cased in request order, or all of them when empty.
+    """
+    if not value:
+        return list(ALGORITHMS)
+    if isinstance(value, str):
+        value = value.split(",")
+    names = []
+    for name in value:
+        name = str(name).strip().upper()
+        if name not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {name}")
+        if name not in names:
+            names.append(name)
+    return names
+
+
+def parse_options(data):
+    """
+    Picks the numeric per-algorithm options (see ALGORITHM_OPTIONS) out of a
+    request body; absent or null fields keep the simulator defaults. All
+    of them must be finite and non-negative.
+    """
+    options = {}
+    for names in ALGORITHM_OPTIONS.values():
+        for option in names:
+            if data.get(option) is not None:
+                try:
+                    options[option] = float(data[option])
+                except (TypeError, ValueError):
+                    raise ValueError(f"{option} must be a number")
+                if not (math.isfinite(options[option]) and options[option] >= 0):
+                    raise ValueError(f"{option} must be finite and non-negative")
+    return options
+
+
+def engine_options(name, options):
+    """
+    The options the SMP and online engines take for name: the switch costs,
+    and aging for PRIORITY.
+    """
+    return {k: v for k, v in (options or {}).items()
+            if k in ENGINE_OPTIONS and k in ALGORITHM_OPTIONS.get(name, ())}
+
+
+def check_quantum(algorithms, quantum):
+    """Rejects a non-positive or non-finite quantum when a time-sliced algorithm is selected."""
+    if not (math.isfinite(quantum) and quantum > 0) and any(name in QUANTUM_ALGORITHMS for name in algorithms):
+        raise ValueError("quantum must be a finite positive number")
+
+
+def simulate_algorithm(name, processes, quantum, options=None):
+    simulate = ALGORITHMS[name][0]
+    kwargs = {k: v for k, v in (options or {}).items() if k in ALGORITHM_OPTIONS.get(name, ())}
+    if name in QUANTUM_ALGORITHMS:
+        return simulate(processes, quantum, **kwargs)
+    return simulate(processes, **kwargs)
+
+
+def chart_id_for(name, schedule, quantum):
+    """
+    Content hash identifying a chart: same algorithm and schedule, same id.
+    """
+    key = [name, quantum if name in QUANTUM_ALGORITHMS else None, [list(seg) for seg in schedule]]
+    payload = json.dumps(key, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def render_chart(name, schedule, quantum, fmt="png"):
+    render = ALGORITHMS[name][1]
+    if name in QUANTUM_ALGORITHMS:
+        return render(schedule, title=f"{name} (q={quantum})", fmt=fmt)
+    return render(schedule, fmt=fmt)
+
+
+def remember_chart(chart_id, name, schedule, quantum):
+    global _charts_bytes
+    size = len(schedule) * CHART_SEGMENT_BYTES
+    if size > CHART_STORE_MAX_BYTES:
+        return
+    with _charts_lock:
+        old = _charts.pop(chart_id, None)
+        if old is not None:
+            _charts_bytes -= old[3]
+        _charts[chart_id] = (name, schedule, quantum, size)
+        _charts_bytes += size
+        while len(_charts) > CHART_STORE_SIZE or _charts_bytes > CHART_STORE_MAX_BYTES:
+            _, evicted = _charts.popitem(last=False)
+            _charts_bytes -= evicted[3]
+
+
+def run_algorithm(name, processes, quantum, render="png", options=None):
+    """
+    Simulates one algorithm and, unless render is "none", renders its Gantt
+    chart. Runs inside a pool worker, so it only takes and returns plain data;
+    its phase timings travel back under "_timings".
+    """
+    timings = Phases()
+    with timings.phase("simulate", name):
+        schedule, stats = simulate_algorithm(name, processes, quantum, options)
+
+    # Columnar Schedule/Stats become plain JSON-ready data only here
+    with timings.phase("serialize", name):
+        result = {
+            "schedule": schedule.to_list(),
+            "stats": normalize_stats(stats),
+            "chart_id": chart_id_for(name, schedule, quantum)
+        }
+    if render != "none":
+        with timings.phase("render", name):
+            result["gantt_image"] = render_chart(name, schedule, quantum, fmt=render)
+        result["gantt_format"] = render
+    result["_timings"] = timings.entries
+    return result
+
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=MAX_WORKERS)
+    return _pool
+
+
+def time_left():
+    """Seconds until the current request's deadline, or None for no limit."""
+    deadline = g.get("deadline") if has_request_context() else None
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+def abandon(futures):
+    """
+    Cancels the futures that have not started. A worker cannot be stopped
+    mid-task, so the ones already running keep the request's admission slot
+    (see release_slot) until they finish: timed-out work still counts
+    against the pool's capacity.
+    """
+    stragglers = [future for future in futures if not future.cancel() and not future.done()]
+    if stragglers and has_request_context():
+        g.setdefault("stragglers", []).extend(stragglers)
+
+
+def release_slot(stragglers=()):
+    """Releases an admission slot once the stragglers are done, at once if there are none."""
+    pending = [future for future in stragglers if not future.done()]
+    if not pending:
+        admission.release()
+        return
+    left = [len(pending)]
+    lock = threading.Lock()
+
+    def finished(_):
+        with lock:
+            left[0] -= 1
+            if left[0]:
+                return
+        admission.release()
+
+    for future in pending:
+        future.add_done_callback(finished)
+
+
+def wait_all(futures):
+    """
+    Results of futures in order, waiting no longer than the request's
+    deadline; on timeout they are abandoned.
+    """
+    try:
+        return [future.result(timeout=time_left()) for future in futures]
+    except FutureTimeout:
+        abandon(futures)
+        raise
+
+
+def run_pooled(calls):
+    """
+    Runs {key: (fn, *args)} on the worker pool so the web worker never does
+    CPU-bound simulation or rendering itself. Falls back to running inline
+    where process pools are unavailable (e.g. no /dev/shm on serverless).
+    """
+    global _pool
+    if MAX_WORKERS > 1:
+        try:
+            pool = get_pool()
+            futures = {key: pool.submit(*call) for key, call in calls.items()}
+            return dict(zip(futures, wait_all(list(futures.values()))))
+        except FutureTimeout:
+            raise   # a TimeoutError is also an OSError on Python 3.11+
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            _pool = None
+
+    return {key: call[0](*call[1:]) for key, call in calls.items()}
+
+
+def check_size(processes):
+    """Rejects workloads above MAX_PROCESSES with 413."""
+    if isinstance(processes, list) and len(processes) > MAX_PROCESSES:
+        raise RequestEntityTooLarge(f"At most {MAX_PROCESSES} processes per request")
+
+
+def heavy(view):
+    """
+    Admission control for CPU-heavy endpoints: waits for a slot in the
+    bounded queue (429 when it is full or the wait exceeds the request
+    timeout) and starts the request's deadline clock.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        started = time.monotonic()
+        if not admission.acquire(timeout=REQUEST_TIMEOUT if REQUEST_TIMEOUT > 0 else None):
+            return overloaded()
+        g.deadline = started + REQUEST_TIMEOUT if REQUEST_TIMEOUT > 0 else None
+        profiler = None
+        if PROFILE_SLOW_MS is not None:
+            profiler = SamplingProfiler(threading.get_ident(), PROFILE_INTERVAL).start()
+        try:
+            return view(*args, **kwargs)
+        finally:
+            release_slot(g.pop("stragglers", ()))
+            if profiler is not None:
+                keep_profile(profiler)
+    return wrapper
+
+
+def keep_profile(profiler):
+    """Stores the profile of a request slower than PROFILE_SLOW_MS."""
+    profiler.stop()
+    if (time.perf_counter() - g.started) * 1000 >= PROFILE_SLOW_MS and profiler.stacks:
+        g.profile_id = uuid.uuid4().hex
+        profiles.put(g.profile_id, profiler.dump())
+
+
+def phase(name, algorithm=None):
+    """Times a block as a phase of the current request."""
+    return g.phases.phase(name, algorithm)
+
+
+def overloaded():
+    response = jsonify({"error": "Server busy; retry later"})
+    response.status_code = 429
+    response.headers["Retry-After"] = "1"
+    return response
+
+
+def respond(payload):
+    """
+    JSON by default; the columnar binary encoding (api/_columnar.py) when
+    the client sends Accept: application/x-schedule-columnar or
+    ?format=columnar.
+    """
+    with phase("encode"):
+        if columnar.accepts_columnar(request.headers.get("Accept"), request.args.get("format")):
+            response = Response(columnar.encode(payload), mimetype=columnar.MIMETYPE)
+        else:
+            response = jsonify(payload)
+    response.vary.add("Accept")
+    return response
+
+
+@app.before_request
+def start_timing():
+    g.started = time.perf_counter()
+    g.phases = Phases()
+
+
+@app.after_request
+def finish_response(response):
+    """
+    Compresses the body, then reports the request's phases in Server-Timing
+    and to /api/metrics. Streamed bodies are timed up to their first byte.
+    """
+    with phase("compress"):
+        response = columnar.compress(response, request.headers.get("Accept-Encoding"))
+    elapsed = time.perf_counter() - g.started
+
+    timing = g.phases.server_timing()
+    response.headers["Server-Timing"] = f"{timing}, total;dur={elapsed * 1000:.3f}" if timing else f"total;dur={elapsed * 1000:.3f}"
+    if g.get("profile_id"):
+        response.headers["X-Profile-Id"] = g.profile_id
+
+    telemetry.record(g.phases.entries)
+    telemetry.observe_request(request.endpoint or "unmatched", request.method, response.status_code, elapsed)
+    return response
+
+
+@app.errorhandler(FutureTimeout)
+def request_timeout(e):
+    return jsonify({"error": f"Request exceeded the {REQUEST_TIMEOUT:g}s time limit"}), 504
+
+
+@app.errorhandler(RequestEntityTooLarge)
+def request_too_large(e):
+    return jsonify({"error": e.description if isinstance(e.description, str) else "Request too large"}), 413
+
+
+def run_algorithms(names, processes, quantum, render="png", options=None):
+    """
+    Runs the selected algorithms on the worker pool so latency is bounded by
+    the slowest one (see run_pooled).
+    """
+    with phase("pool"):
+        results = run_pooled({name: (run_algorithm, name, processes, quantum, render, options) for name in names})
+    for name, result in results.items():
+        g.phases.extend(result.pop("_timings"))
+        telemetry.count("segments", name, len(result["schedule"]))
+        telemetry.count("processes", name, len(processes))
+        telemetry.count("context_switches", name, int(result["stats"].get("context_switches", 0)))
+    return results
+
+
+def run_metrics(names, processes, quantum, options=None, objective=None):
+    """
+    Simulates the given algorithms without rendering and returns only the
+    aggregate (non per-process) stats. Used by the batch endpoint.
+    """
+    metrics = {}
+    for name in names:
+        _, stats = simulate_algorithm(name, processes, quantum, options)
+        metrics[name] = normalize_stats(stats.summary)
+
+    best, _ = select_best(metrics, objective or parse_objective(None))
+    return {"quantum": quantum, "metrics": metrics, "best_algorithm": best}
+
+
+def run_smp(name, processes, quantum, cpus, queue, steal, options=None):
+    """
+    Simulates one algorithm on cpus processors; returns per-CPU schedules
+    and utilization alongside the usual stats.
+    """
+    schedules, stats, utilization = smp_schedule(processes, name, cpus, quantum, queue, steal,
+                                                 **engine_options(name, options))
+    return {
+        "cpus": [
+            {"schedule": sched.to_list(), "utilization": util}
+            for sched, util in zip(schedules, utilization)
+        ],
+        "stats": normalize_stats(stats)
+    }
+
+
+def get_session(session_id):
+    with _sessions_lock:
+        entry = _sessions.get(session_id)
+        if entry is not None:
+            _sessions.move_to_end(session_id)
+        return entry
+
+
+def session_status(session_id, engine):
+    return {"session_id": session_id, **engine.status()}
+
+
+def run_io(name, processes, quantum, options=None):
+    """
+    Simulates one algorithm over CPU/I-O burst sequences; returns the CPU
+    schedule, one schedule per device and device utilization.
+    """
+    schedule, stats, devices = io_schedule(processes, name, quantum, **engine_options(name, options))
+    summary = normalize_stats(stats)
+    return {
+        "schedule": schedule.to_list(),
+        "devices": {
+            device: {"schedule": sched.to_list(), "utilization": summary[f"device_utilization_{device}"]}
+            for device, sched in devices.items()
+        },
+        "stats": summary
+    }
+
+
+def positive_quantum(value, field):
+    """value as a finite positive float; otherwise a ValueError naming field and value."""
+    try:
+        quantum = float(value)
+    except (TypeError, ValueError):
+        quantum = math.nan
+    if not (math.isfinite(quantum) and quantum > 0):
+        raise ValueError(f"{field} {value!r} is not a finite positive number")
+    return quantum
+
+
+def quantum_values(spec):
+    """
+    Expands {"start", "stop", "step"} (inclusive) or a plain list into quanta,
+    at most MAX_BATCH_WORKLOADS of them. Every value must be a finite
+    positive number.
+    """
+    if isinstance(spec, list):
+        if len(spec) > MAX_BATCH_WORKLOADS:
+            raise ValueError(f"quantum_range lists more than {MAX_BATCH_WORKLOADS} quanta")
+        return [positive_quantum(q, "quantum_range entry") for q in spec]
+    if not isinstance(spec, dict):
+        raise ValueError("quantum_range must be a list or {start, stop, step}")
+    start = positive_quantum(spec.get("start", 1), "quantum_range start")
+    stop = positive_quantum(spec.get("stop", start), "quantum_range stop")
+    step = positive_quantum(spec.get("step", 1), "quantum_range step")
+    if stop < start:
+        raise ValueError("quantum_range stop is below start")
+    # compared as a float first: a tiny step could overflow int()
+    span = (stop - start) / step + 1e-9
+    if span >= MAX_BATCH_WORKLOADS:
+        raise ValueError(f"quantum_range expands to more than {MAX_BATCH_WORKLOADS} workloads")
+    return [start + k * step for k in range(int(span) + 1)]
+
+
+def sweep_quanta(processes, quanta, switch_cost=0.0, cache_penalty=0.0):
+    """
+    Runs rr_sweep over quanta, split across the worker pool. Processes are
+    normalized and sorted once here and shipped presorted to every worker.
+    Chunks interleave quanta so small (expensive) ones spread evenly.
+    """
+    global _pool
+    proc_list = normalize_processes(processes)
+    chunks = min(MAX_WORKERS, len(quanta))
+    if chunks > 1:
+        try:
+            pool = get_pool()
+            futures = [
+                pool.submit(rr_sweep, proc_list, quanta[k::chunks], True, switch_cost, cache_penalty)
+                for k in range(chunks)
+            ]
+            points = [point for chunk in wait_all(futures) for point in chunk]
+            return sorted(points, key=lambda point: point["quantum"])
+        except FutureTimeout:
+            raise
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            _pool = None
+    return rr_sweep(proc_list, quanta, True, switch_cost, cache_penalty)
+
+
+def recommend_quantum(points, objective):
+    """
+    Picks the quantum minimizing objective (switch overhead is already part
+    of the simulation); ties go to the larger quantum (fewer switches).
+    """
+    best = min(points, key=lambda point: (point[objective], point["context_switches"], -point["quantum"]))
+    return best["quantum"], best[objective]
+
+
+def iter_batch(jobs):
+    """
+    Yields (index, result) as each job finishes, using the worker pool when
+    available. A failing workload yields an error entry instead of aborting;
+    once the request's deadline passes, every unfinished job yields a
+    timeout entry.
+    """
+    global _pool
+    done = set()
+    timed_out = {"error": f"Request exceeded the {REQUEST_TIMEOUT:g}s time limit"}
+    if MAX_WORKERS > 1 and len(jobs) > 1:
+        try:
+            pool = get_pool()
+            futures = {pool.submit(run_metrics, *job): index for index, job in enumerate(jobs)}
+            try:
+                for future in as_completed(futures, timeout=time_left()):
+                    index = futures[future]
+                    try:
+                        result = future.result()
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as e:
+                        result = {"error": str(e)}
+                    done.add(index)
+                    yield index, result
+            except FutureTimeout:
+                pass
+            finally:
+                # Also runs when a client disconnect closes the stream early
+                abandon(futures)
+            for index in range(len(jobs)):
+                if index not in done:
+                    yield index, timed_out
+            return
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            _pool = None
+
+    # Inline fallback picks up whatever the pool did not finish
+    for index, job in enumerate(jobs):
+        if index in done:
+            continue
+        if time_left() == 0:
+            yield index, timed_out
+            continue
+        try:
+            yield index, run_metrics(*job)
+        except Exception as e:
+            yield index, {"error": str(e)}
 
 
 @app.route("/")
@@ -52,67 +645,108 @@ def serve_static_files(filename):
 def home():
     return jsonify({
         "status": "active",
-        "message": "Scheduler API is running."
+        "message": "Scheduler API is running.",
+        "cache": result_cache.stats(),
+        "admission": admission.stats()
     })
 
 
+@app.route("/api/metrics")
+def metrics():
+    """Prometheus text exposition of this worker's counters."""
+    gauges = [
+        (f"scheduler_cache_{name}", f"Result cache {name.replace('_', ' ')}.", {(): value})
+        for name, value in result_cache.stats().items()
+    ] + [
+        (f"scheduler_admission_{name}", f"Admission gate {name}.", {(): value})
+        for name, value in admission.stats().items()
+    ] + [
+        ("scheduler_sessions", "Open online simulation sessions.", {(): len(_sessions)}),
+    ]
+    return Response(telemetry.render(gauges), mimetype="text/plain; version=0.0.4")
+
+
+@app.route("/api/profiles/<profile_id>")
+def profile(profile_id):
+    """A slow request's collapsed-stack profile (see PROFILE_SLOW_MS)."""
+    text = profiles.get(profile_id)
+    if text is None:
+        return jsonify({"error": "Unknown profile id"}), 404
+    return Response(text, mimetype="text/plain")
+
+
 @app.route("/api/schedule", methods=["POST"])
+@heavy
 def schedule():
+    """
+    Runs the selected algorithms. best_algorithm minimizes "objective": a
+    metric name or {metric: weight} (default avg_waiting_time); the response
+    also carries each algorithm's score and the Pareto front over "pareto"
+    (default: waiting, response, throughput, utilization, fairness).
+    """
     try:
-        data = request.get_json()
+        with phase("parse"):
+            data = request.get_json()
         if not data:
             return jsonify({"error": "No JSON data received"}), 400
 
         processes = data.get("processes", [])
+        check_size(processes)
         quantum = safe_float(data.get("quantum", 2), default=2)
 
-        results = {}
+        try:
+            algorithms = parse_algorithms(data.get("algorithms") or request.args.get("algorithms"))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
 
-        fcfs_schedule, fcfs_stats = fcfs(processes)
-        results["FCFS"] = {
-            "schedule": fcfs_schedule,
-            "stats": normalize_stats(fcfs_stats),
-            "gantt_image": generate_fcfs_gantt(fcfs_schedule)
-        }
+        render = str(request.args.get("render") or data.get("render") or "png").lower()
+        if render not in RENDER_MODES:
+            return jsonify({"error": f"render must be one of {', '.join(RENDER_MODES)}"}), 400
 
-        sjf_schedule, sjf_stats = sjf(processes)
-        results["SJF"] = {
-            "schedule": sjf_schedule,
-            "stats": normalize_stats(sjf_stats),
-            "gantt_image": generate_sjf_gantt(sjf_schedule)
-        }
+        try:
+            check_quantum(algorithms, quantum)
+            options = parse_options(data)
+            objective = parse_objective(data.get("objective"))
+            pareto = parse_pareto_metrics(data.get("pareto"))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
 
-        srtf_schedule, srtf_stats = srtf(processes)
-        results["SRTF"] = {
-            "schedule": srtf_schedule,
-            "stats": normalize_stats(srtf_stats),
-            "gantt_image": generate_srtf_gantt(srtf_schedule)
-        }
+        with phase("cache"):
+            key = canonical_key(processes, quantum=quantum, algorithms=algorithms, render=render,
+                                objective=objective, pareto=pareto, **options)
+            payload = result_cache.get(key)
+        cache_status = "HIT" if payload is not None else "MISS"
 
-        pr_schedule, pr_stats = priority_scheduling(processes)
-        results["PRIORITY"] = {
-            "schedule": pr_schedule,
-            "stats": normalize_stats(pr_stats),
-            "gantt_image": generate_priority_gantt(pr_schedule)
-        }
+        if payload is None:
+            try:
+                results = run_algorithms(algorithms, processes, quantum, render, options)
+            except (TypeError, ValueError) as e:
+                return jsonify({"error": str(e)}), 400
 
-        rr_schedule, rr_stats = round_robin(processes, quantum)
-        results["RR"] = {
-            "schedule": rr_schedule,
-            "stats": normalize_stats(rr_stats),
-            "gantt_image": generate_gantt_image(rr_schedule, title=f"RR (q={quantum})")
-        }
+            # Selection only reads the summaries computed during simulation
+            summaries = {name: results[name]["stats"] for name in algorithms}
+            best, scores = select_best(summaries, objective)
 
-        best = min(
-            results.keys(),
-            key=lambda algo: results[algo]["stats"].get("avg_waiting_time", float("inf"))
-        )
+            payload = {
+                "results": results,
+                "best_algorithm": best,
+                "objective": objective,
+                "scores": scores,
+                "pareto_metrics": pareto,
+                "pareto_front": pareto_front(summaries, pareto)
+            }
 
-        return jsonify({
-            "results": results,
-            "best_algorithm": best
-        })
+        for name, result in payload["results"].items():
+            remember_chart(result["chart_id"], name, result["schedule"], quantum)
 
+        response = respond(payload)
+        if cache_status == "MISS":
+            result_cache.put(key, payload, response.content_length)
+        response.headers["X-Cache"] = cache_status
+        return response
+
+    except (HTTPException, FutureTimeout):
+        raise
     except Exception as e:
         traceback.print_exc()
         return jsonify({
@@ -121,5 +755,389 @@ def schedule():
         }), 500
 
 
+@app.route("/api/schedule/batch", methods=["POST"])
+def schedule_batch():
+    """
+    Accepts {"workloads": [{"processes", "quantum", "algorithms"}, ...]} or
+    {"processes", "quantum_range"} for a round robin sweep, and streams one
+    NDJSON line of compact metrics per workload as it finishes. best_algorithm
+    follows "objective" as in /api/schedule.
+    """
+    data = request.get_json(silent=True)
+    if not data:
+        return jsonify({"error": "No JSON data received"}), 400
+
+    default_quantum = safe_float(data.get("quantum", 2), default=2)
+
+    try:
+        default_options = parse_options(data)
+        default_objective = parse_objective(data.get("objective"))
+        jobs = []
+        if "quantum_range" in data:
+            algorithms = parse_algorithms(data.get("algorithms") or ["RR"])
+            processes = data.get("processes", [])
+            for q in quantum_values(data["quantum_range"]):
+                check_quantum(algorithms, q)
+                jobs.append((algorithms, processes, q, default_options, default_objective))
+        else:
+            default_algorithms = parse_algorithms(data.get("algorithms"))
+            for workload in data.get("workloads", []):
+                if isinstance(workload, list):
+                    workload = {"processes": workload}
+                algorithms = parse_algorithms(workload.get("algorithms")) if workload.get("algorithms") else default_algorithms
+                quantum = safe_float(workload.get("quantum", default_quantum), default=default_quantum)
+                check_quantum(algorithms, quantum)
+                options = {**default_options, **parse_options(workload)}
+                objective = parse_objective(workload["objective"]) if workload.get("objective") else default_objective
+                jobs.append((algorithms, workload.get("processes", []), quantum, options, objective))
+    except (ValueError, AttributeError) as e:
+        return jsonify({"error": str(e)}), 400
+
+    if not jobs:
+        return jsonify({"error": "No workloads given"}), 400
+    if len(jobs) > MAX_BATCH_WORKLOADS:
+        return jsonify({"error": f"At most {MAX_BATCH_WORKLOADS} workloads per batch"}), 400
+    for job in jobs:
+        check_size(job[1])
+
+    # The slot is held until the stream is closed, not just until this
+    # view returns
+    started = time.monotonic()
+    if not admission.acquire(timeout=REQUEST_TIMEOUT if REQUEST_TIMEOUT > 0 else None):
+        return overloaded()
+    g.deadline = started + REQUEST_TIMEOUT if REQUEST_TIMEOUT > 0 else None
+
+    released = []
+
+    def release():
+        if not released:
+            released.append(True)
+            release_slot(g.pop("stragglers", ()) if has_request_context() else ())
+
+    def generate():
+        results = iter_batch(jobs)
+        try:
+            for index, result in results:
+                yield json.dumps({"index": index, **result}) + "\n"
+        finally:
+            results.close()
+            release()
+
+    response = Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+    response.call_on_close(release)
+    return response
+
+
+@app.route("/api/schedule/smp", methods=["POST"])
+@heavy
+def schedule_smp():
+    """
+    Multi-processor simulation: {"processes", "cpus", "queue": "global" |
+    "per_cpu", "steal", "quantum", "algorithms"}, plus aging_rate and the
+    switch costs as in /api/schedule. Processes may carry an "affinity" CPU
+    index. Returns per-CPU schedules and utilization.
+    """
+    data = request.get_json(silent=True)
+    if not data:
+        return jsonify({"error": "No JSON data received"}), 400
+
+    processes = data.get("processes", [])
+    check_size(processes)
+    quantum = safe_float(data.get("quantum", 2), default=2)
+    queue = str(data.get("queue", "global")).lower()
+    steal = data.get("steal", True)
+    if isinstance(steal, str):
+        steal = steal.lower() not in ("0", "false", "no")
+
+    try:
+        cpus = int(data.get("cpus", 2))
+        selector = data.get("algorithms") or request.args.get("algorithms")
+        algorithms = parse_algorithms(selector) if selector else list(SMP_POLICIES)
+        options = {k: v for k, v in parse_options(data).items() if k in ENGINE_OPTIONS}
+    except (TypeError, ValueError) as e:
+        return jsonify({"error": str(e)}), 400
+    if not 1 <= cpus <= MAX_SMP_CPUS:
+        return jsonify({"error": f"cpus must be between 1 and {MAX_SMP_CPUS}"}), 400
+    if queue not in QUEUE_MODES:
+        return jsonify({"error": f"queue must be one of {', '.join(QUEUE_MODES)}"}), 400
+    unsupported = [name for name in algorithms if name not in SMP_POLICIES]
+    if unsupported:
+        return jsonify({"error": f"SMP mode does not support {', '.join(unsupported)}"}), 400
+
+    key = canonical_key(processes, endpoint="smp", quantum=quantum, cpus=cpus, queue=queue,
+                        steal=bool(steal), algorithms=algorithms, **options)
+    payload = result_cache.get(key)
+    cache_status = "HIT" if payload is not None else "MISS"
+
+    if payload is None:
+        try:
+            results = run_pooled({name: (run_smp, name, processes, quantum, cpus, queue, bool(steal), options)
+                                  for name in algorithms})
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        best = min(
+            results.keys(),
+            key=lambda algo: results[algo]["stats"].get("avg_waiting_time", float("inf"))
+        )
+        payload = {
+            "results": results,
+            "best_algorithm": best
+        }
+
+    response = respond(payload)
+    if cache_status == "MISS":
+        result_cache.put(key, payload, response.content_length)
+    response.headers["X-Cache"] = cache_status
+    return response
+
+
+@app.route("/api/schedule/io", methods=["POST"])
+@heavy
+def schedule_io():
+    """
+    CPU/I-O burst simulation: processes carry "bursts", alternating CPU and
+    I/O bursts (an I/O burst is a number or {"device", "duration"}). Returns
+    the CPU schedule, per-device schedules and utilization per algorithm;
+    aging_rate, the switch costs and best_algorithm's "objective" work as
+    in /api/schedule.
+    """
+    data = request.get_json(silent=True)
+    if not data:
+        return jsonify({"error": "No JSON data received"}), 400
+
+    processes = data.get("processes", [])
+    check_size(processes)
+    quantum = safe_float(data.get("quantum", 2), default=2)
+
+    try:
+        selector = data.get("algorithms") or request.args.get("algorithms")
+        algorithms = parse_algorithms(selector) if selector else list(IO_POLICIES)
+        objective = parse_objective(data.get("objective"))
+        options = {k: v for k, v in parse_options(data).items() if k in ENGINE_OPTIONS}
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    unsupported = [name for name in algorithms if name not in IO_POLICIES]
+    if unsupported:
+        return jsonify({"error": f"I/O mode does not support {', '.join(unsupported)}"}), 400
+
+    key = canonical_key(processes, endpoint="io", quantum=quantum, algorithms=algorithms,
+                        objective=objective, **options)
+    payload = result_cache.get(key)
+    cache_status = "HIT" if payload is not None else "MISS"
+
+    if payload is None:
+        try:
+            results = run_pooled({name: (run_io, name, processes, quantum, options) for name in algorithms})
+        except (TypeError, ValueError) as e:
+            return jsonify({"error": str(e)}), 400
+
+        best, scores = select_best({name: results[name]["stats"] for name in algorithms}, objective)
+        payload = {
+            "results": results,
+            "best_algorithm": best,
+            "objective": objective,
+            "scores": scores
+        }
+
+    response = respond(payload)
+    if cache_status == "MISS":
+        result_cache.put(key, payload, response.content_length)
+    response.headers["X-Cache"] = cache_status
+    return response
+
+
+@app.route("/api/sessions", methods=["POST"])
+def create_session():
+    """
+    Starts an online simulation: {"algorithm", "quantum"}, plus aging_rate
+    and the switch costs as in /api/schedule. Processes are then submitted
+    incrementally and the clock only moves when asked to.
+    """
+    data = request.get_json(silent=True) or {}
+    try:
+        algorithm = str(data.get("algorithm", "FCFS")).upper()
+        engine = OnlineScheduler(algorithm, safe_float(data.get("quantum", 2), default=2),
+                                 **engine_options(algorithm, parse_options(data)))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    session_id = uuid.uuid4().hex
+    with _sessions_lock:
+        _sessions[session_id] = (threading.Lock(), engine)
+        while len(_sessions) > MAX_SESSIONS:
+            _sessions.popitem(last=False)
+    return jsonify(session_status(session_id, engine)), 201
+
+
+@app.route("/api/sessions/<session_id>", methods=["GET", "DELETE"])
+def session(session_id):
+    entry = get_session(session_id)
+    if entry is None:
+        return jsonify({"error": "Unknown session id"}), 404
+    if request.method == "DELETE":
+        with _sessions_lock:
+            _sessions.pop(session_id, None)
+        return jsonify({"session_id": session_id, "deleted": True})
+    lock, engine = entry
+    with lock:
+        return jsonify(session_status(session_id, engine))
+
+
+@app.route("/api/sessions/<session_id>/processes", methods=["POST"])
+@heavy
+def submit_processes(session_id):
+    """
+    Submits {"processes": [...]}; a missing arrival means the session's
+    current time. "advance_to" optionally moves the clock afterwards.
+    """
+    entry = get_session(session_id)
+    if entry is None:
+        return jsonify({"error": "Unknown session id"}), 404
+    data = request.get_json(silent=True) or {}
+    processes = data.get("processes", [])
+    if isinstance(processes, dict):
+        processes = [processes]
+    check_size(processes)
+
+    lock, engine = entry
+    with lock:
+        for accepted, p in enumerate(processes):
+            try:
+                engine.submit(p)
+            except (AttributeError, TypeError, ValueError) as e:
+                return jsonify({"error": str(e), "accepted": accepted}), 400
+        if data.get("advance_to") is not None:
+            engine.advance(safe_float(data["advance_to"], default=engine.now))
+        return jsonify(session_status(session_id, engine))
+
+
+@app.route("/api/sessions/<session_id>/advance", methods=["POST"])
+@heavy
+def advance_session(session_id):
+    """Moves the clock to {"until": t}, or to the end with {"drain": true}."""
+    entry = get_session(session_id)
+    if entry is None:
+        return jsonify({"error": "Unknown session id"}), 404
+    data = request.get_json(silent=True) or {}
+
+    lock, engine = entry
+    with lock:
+        if data.get("drain"):
+            engine.drain()
+        elif data.get("until") is not None:
+            try:
+                engine.advance(float(data["until"]))
+            except (TypeError, ValueError):
+                return jsonify({"error": "until must be a number"}), 400
+        else:
+            return jsonify({"error": "Give until or drain"}), 400
+        return jsonify(session_status(session_id, engine))
+
+
+@app.route("/api/sessions/<session_id>/schedule")
+def session_schedule(session_id):
+    """
+    CPU and device segments from index ?since= on. The last CPU segment may
+    still grow while its process runs, so poll again from next - 1.
+    """
+    entry = get_session(session_id)
+    if entry is None:
+        return jsonify({"error": "Unknown session id"}), 404
+    since = max(0, int(safe_float(request.args.get("since", 0))))
+
+    lock, engine = entry
+    with lock:
+        return respond({
+            "session_id": session_id,
+            "time": engine.now,
+            "since": since,
+            "next": len(engine.schedule),
+            "schedule": engine.schedule[since:],
+            "devices": {name: sched.to_list() for name, sched in sorted(engine.device_schedules.items())},
+        })
+
+
+@app.route("/api/schedule/quantum-sweep", methods=["POST"])
+@heavy
+def quantum_sweep():
+    """
+    Sweeps the round robin quantum: {"processes", "quantum_range":
+    {"start", "stop", "step"} or a list, "objective", "switch_cost",
+    "cache_penalty"}. Returns one curve per metric against quantum and a
+    recommended quantum.
+    """
+    data = request.get_json(silent=True)
+    if not data:
+        return jsonify({"error": "No JSON data received"}), 400
+
+    processes = data.get("processes", [])
+    check_size(processes)
+    objective = str(data.get("objective", "avg_waiting_time"))
+    if objective not in SWEEP_OBJECTIVES:
+        return jsonify({"error": f"objective must be one of {', '.join(SWEEP_OBJECTIVES)}"}), 400
+    if not processes:
+        return jsonify({"error": "No processes given"}), 400
+
+    try:
+        options = parse_options(data)
+        quanta = sorted(set(quantum_values(data.get("quantum_range", {"start": 0.5, "stop": 10, "step": 0.5}))))
+        if not quanta:
+            raise ValueError("quantum_range is empty")
+    except (ValueError, AttributeError) as e:
+        return jsonify({"error": str(e)}), 400
+    switch_cost = options.get("switch_cost", 0.0)
+    cache_penalty = options.get("cache_penalty", 0.0)
+
+    key = canonical_key(processes, endpoint="quantum-sweep", quanta=quanta, objective=objective,
+                        switch_cost=switch_cost, cache_penalty=cache_penalty)
+    payload = result_cache.get(key)
+    cache_status = "HIT" if payload is not None else "MISS"
+
+    if payload is None:
+        points = sweep_quanta(processes, quanta, switch_cost, cache_penalty)
+        best, score = recommend_quantum(points, objective)
+        bursts = sorted(safe_float(p.get("burst", 0)) for p in processes)
+        payload = {
+            "quanta": [point["quantum"] for point in points],
+            "curves": {
+                metric: [point[metric] for point in points]
+                for metric in ("avg_waiting_time", "avg_turnaround_time", "avg_response_time",
+                               "p95_waiting_time", "context_switches", "switch_overhead_time")
+            },
+            "objective": objective,
+            "switch_cost": switch_cost,
+            "cache_penalty": cache_penalty,
+            "recommended_quantum": best,
+            "recommended_score": score,
+            # Textbook rule: about 80% of bursts should fit in one quantum
+            "rule_of_thumb_quantum": bursts[min(len(bursts) - 1, int(0.8 * len(bursts)))]
+        }
+
+    response = jsonify(payload)
+    if cache_status == "MISS":
+        result_cache.put(key, payload, response.content_length)
+    response.headers["X-Cache"] = cache_status
+    return response
+
+
+@app.route("/api/chart/<chart_id>")
+@heavy
+def chart(chart_id):
+    fmt = str(request.args.get("format", "png")).lower()
+    if fmt not in CHART_MIMETYPES:
+        return jsonify({"error": "format must be png or svg"}), 400
+
+    with _charts_lock:
+        entry = _charts.get(chart_id)
+    if entry is None:
+        return jsonify({"error": "Unknown chart id; re-run /api/schedule"}), 404
+
+    name, schedule, quantum, _ = entry
+    image = base64.b64decode(run_pooled({"chart": (render_chart, name, schedule, quantum, fmt)})["chart"])
+    return Response(image, mimetype=CHART_MIMETYPES[fmt])
+
+
 if __name__ == "__main__":
-    app.run(debug=True)
+    # Threaded, so a slow request waiting on the pool never blocks the others
+    app.run(debug=True, threaded=True)
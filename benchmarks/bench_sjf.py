@@ -0,0 +1,41 @@
+"""
+Scaling benchmark for non-preemptive SJF.
+
+Submits processes in batches that arrive together (the worst case for the
+old sort-per-dispatch ready list) and reports wall time per size.
+
+Usage:
+    python benchmarks/bench_sjf.py [max_exponent]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from schedulers.sjf import sjf
+
+
+def batch_workload(n, batch_size=1000, seed=42):
+    rng = random.Random(seed)
+    return [
+        {"pid": i, "arrival": float(i // batch_size) * 10.0, "burst": float(rng.randint(1, 100))}
+        for i in range(n)
+    ]
+
+
+def main():
+    max_exp = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    print(f"{'n':>10} {'seconds':>10} {'proc/s':>12}")
+    for exp in range(2, max_exp + 1):
+        n = 10 ** exp
+        processes = batch_workload(n)
+        t0 = time.perf_counter()
+        schedule, stats = sjf(processes)
+        elapsed = time.perf_counter() - t0
+        print(f"{n:>10} {elapsed:>10.3f} {n / elapsed:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Compares two benchmark result files written by benchmarks/run.py.
+
+Usage:
+    python benchmarks/compare.py BASELINE.json CANDIDATE.json [--threshold 1.2]
+
+Prints the time ratio (candidate / baseline) for every matching case and
+exits with status 1 if any case got slower than the threshold.
+"""
+import argparse
+import json
+import sys
+
+
+def key(row):
+    return (row["suite"], row["algorithm"], row["workload"], row["n"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=1.2,
+                        help="time ratio above which a case counts as a regression")
+    args = parser.parse_args(argv)
+
+    with open(args.baseline) as f:
+        base = {key(r): r for r in json.load(f)["results"]}
+    with open(args.candidate) as f:
+        cand = {key(r): r for r in json.load(f)["results"]}
+
+    regressions = 0
+    print(f"{'suite':>9} {'algorithm':>9} {'workload':>22} {'n':>9} {'base s':>9} {'new s':>9} {'ratio':>7}")
+    for k in sorted(base.keys() & cand.keys(), key=str):
+        b, c = base[k]["seconds"], cand[k]["seconds"]
+        ratio = c / b if b else float("inf")
+        flag = ""
+        if ratio > args.threshold:
+            regressions += 1
+            flag = "  REGRESSION"
+        print(f"{k[0]:>9} {k[1]:>9} {k[2]:>22} {k[3]:>9} {b:9.3f} {c:9.3f} {ratio:7.2f}{flag}")
+
+    missing = base.keys() - cand.keys()
+    if missing:
+        print(f"{len(missing)} baseline cases missing from candidate")
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+Benchmark harness for the schedulers and the /api/schedule endpoint.
+
+Runs every algorithm over seeded synthetic workloads at sizes 10^min..10^max,
+recording wall time, throughput and peak traced memory, then times the API
+end to end through the Flask test client, plus the API's cold-start import
+time in a fresh interpreter. Results are written as JSON so runs
+from different commits can be diffed with benchmarks/compare.py.
+
+Usage:
+    python benchmarks/run.py [--min-exp 2] [--max-exp 5] [--output bench.json]
+                             [--algorithms FCFS,RR] [--workloads poisson]
+                             [--no-memory] [--no-api] [--no-import]
+
+The dict-based schedulers hold one dict per process, so sizes beyond 10^6
+need several GB of RAM; FCFS_NP (the array engine) is cheap up to 10^7.
+FCFS_K and SJF_K run FCFS and SJF on the event kernel (schedulers.kernel)
+that SRTF, PRIORITY and RR use, so all five compare on the same core.
+"""
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from benchmarks.workloads import WORKLOADS, to_processes
+from schedulers.fcfs import fcfs
+from schedulers.sjf import sjf
+from schedulers.srtf import srtf
+from schedulers.priority import priority_scheduling
+from schedulers.rr import round_robin
+from schedulers.mlfq import mlfq
+from schedulers.smp import smp_schedule
+from schedulers.vectorized import fcfs_arrays
+from schedulers import kernel
+
+QUANTUM = 2.0
+
+# name -> (takes columns instead of dicts, runner)
+ALGORITHMS = {
+    "FCFS": (False, fcfs),
+    "FCFS_NP": (True, lambda cols: fcfs_arrays(cols[0], cols[1])),
+    "SJF": (False, sjf),
+    # FCFS and SJF on the shared event kernel, like SRTF, PRIORITY and RR
+    "FCFS_K": (False, lambda procs: kernel.simulate(procs, kernel.FCFS())),
+    "SJF_K": (False, lambda procs: kernel.simulate(procs, kernel.SJF())),
+    "SRTF": (False, srtf),
+    "PRIORITY": (False, priority_scheduling),
+    "RR": (False, lambda procs: round_robin(procs, QUANTUM)),
+    "MLFQ": (False, lambda procs: mlfq(procs, QUANTUM)),
+    "SMP_SRTF": (False, lambda procs: smp_schedule(procs, "SRTF", cpus=4, queue="per_cpu")),
+}
+
+
+def measure(fn, arg, memory=True):
+    gc.collect()
+    t0 = time.perf_counter()
+    fn(arg)
+    seconds = time.perf_counter() - t0
+
+    peak = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        fn(arg)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return seconds, peak
+
+
+def bench_schedulers(algorithms, workloads, sizes, memory):
+    results = []
+    for workload in workloads:
+        for n in sizes:
+            columns = WORKLOADS[workload](n, seed=n)
+            processes = None
+            for name in algorithms:
+                takes_columns, fn = ALGORITHMS[name]
+                if not takes_columns and processes is None:
+                    processes = to_processes(*columns)
+                seconds, peak = measure(fn, columns if takes_columns else processes, memory)
+                row = {
+                    "suite": "scheduler",
+                    "algorithm": name,
+                    "workload": workload,
+                    "n": n,
+                    "seconds": seconds,
+                    "throughput": n / seconds if seconds else None,
+                    "peak_bytes": peak,
+                }
+                results.append(row)
+                print(f"{name:>9} {workload:>14} n={n:<9} {seconds:9.3f}s "
+                      f"{row['throughput'] or 0:12.0f} proc/s"
+                      + (f" {peak / 2 ** 20:9.1f} MiB" if peak is not None else ""))
+            del processes
+    return results
+
+
+def bench_api(sizes, png_sizes, repeat=3):
+    # Disable the response cache so every request does the full work
+    os.environ["SCHEDULE_CACHE_SIZE"] = "0"
+    os.environ.pop("SCHEDULE_CACHE_DIR", None)
+    sys.path.append(os.path.join(ROOT, "api"))
+    import index
+
+    client = index.app.test_client()
+    results = []
+    for n in sizes:
+        processes = to_processes(*WORKLOADS["poisson"](n, seed=n))
+        for render in ("none", "png") if n in png_sizes else ("none",):
+            timings = []
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                resp = client.post(f"/api/schedule?render={render}", json={"processes": processes, "quantum": QUANTUM})
+                timings.append(time.perf_counter() - t0)
+                if resp.status_code != 200:
+                    raise RuntimeError(f"/api/schedule returned {resp.status_code}: {resp.get_data(as_text=True)[:200]}")
+            seconds = min(timings)
+            results.append({
+                "suite": "api",
+                "algorithm": "ALL",
+                "workload": f"poisson/render={render}",
+                "n": n,
+                "seconds": seconds,
+                "throughput": 1.0 / seconds,
+                "peak_bytes": None,
+                "response_bytes": len(resp.get_data()),
+            })
+            print(f"{'API':>9} {'render=' + render:>14} n={n:<9} {seconds:9.3f}s {len(resp.get_data()):12d} bytes")
+    return results
+
+
+IMPORT_PROBE = """
+import sys, time
+t0 = time.perf_counter()
+sys.path.insert(0, {api!r})
+import index
+t1 = time.perf_counter()
+loaded = "matplotlib.pyplot" in sys.modules
+index.render_chart("FCFS", [("1", 0.0, 1.0)], 2.0)
+t2 = time.perf_counter()
+print(t1 - t0, t2 - t1, loaded)
+"""
+
+
+def bench_import(repeat=5):
+    """
+    Cold-start cost: importing the API module in a fresh interpreter, and the
+    extra time the first chart request spends loading matplotlib.
+    """
+    probe = IMPORT_PROBE.format(api=os.path.join(ROOT, "api"))
+    imports, first_charts = [], []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True).stdout.split()
+        imports.append(float(out[0]))
+        first_charts.append(float(out[1]))
+        pyplot_at_import = out[2] == "True"
+
+    results = []
+    for phase, timings in (("import", imports), ("first_chart", first_charts)):
+        seconds = sorted(timings)[len(timings) // 2]
+        results.append({
+            "suite": "cold_start",
+            "algorithm": "API",
+            "workload": phase,
+            "n": 1,
+            "seconds": seconds,
+            "throughput": None,
+            "peak_bytes": None,
+            "pyplot_at_import": pyplot_at_import,
+        })
+        print(f"{'API':>9} {phase:>14} {'':<11} {seconds:9.3f}s (median of {repeat})"
+              + (" pyplot loaded at import" if pyplot_at_import and phase == "import" else ""))
+    return results
+
+
+def metadata():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--min-exp", type=int, default=2)
+    parser.add_argument("--max-exp", type=int, default=5)
+    parser.add_argument("--algorithms", default=",".join(ALGORITHMS))
+    parser.add_argument("--workloads", default=",".join(WORKLOADS))
+    parser.add_argument("--api-max-exp", type=int, default=3)
+    parser.add_argument("--api-png-max-exp", type=int, default=3,
+                        help="largest size rendered to PNG; charts grow with the process count")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--no-api", action="store_true", help="skip the /api/schedule timings")
+    parser.add_argument("--no-import", action="store_true", help="skip the cold-start import timings")
+    parser.add_argument("--output", default="bench_results.json")
+    args = parser.parse_args(argv)
+
+    algorithms = [a.strip().upper() for a in args.algorithms.split(",") if a.strip()]
+    workloads = [w.strip() for w in args.workloads.split(",") if w.strip()]
+    for name in algorithms:
+        if name not in ALGORITHMS:
+            parser.error(f"unknown algorithm {name}")
+    for name in workloads:
+        if name not in WORKLOADS:
+            parser.error(f"unknown workload {name}")
+
+    sizes = [10 ** e for e in range(args.min_exp, args.max_exp + 1)]
+    results = [] if args.no_import else bench_import()
+    results += bench_schedulers(algorithms, workloads, sizes, not args.no_memory)
+    if not args.no_api:
+        api_sizes = [10 ** e for e in range(args.min_exp, min(args.max_exp, args.api_max_exp) + 1)]
+        png_sizes = [n for n in api_sizes if n <= 10 ** args.api_png_max_exp]
+        results += bench_api(api_sizes, png_sizes)
+
+    with open(args.output, "w") as f:
+        json.dump({"meta": metadata(), "results": results}, f, indent=2)
+    print(f"wrote {len(results)} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
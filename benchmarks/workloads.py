@@ -0,0 +1,59 @@
+"""
+Seeded synthetic workload generators for the benchmark suite.
+
+Every generator returns parallel NumPy columns (arrival, burst, priority) so
+very large traces stay compact; to_processes() turns them into the list of
+dicts the scheduler functions take.
+"""
+import numpy as np
+
+
+def poisson(n, seed=0, rate=1.0, mean_burst=0.9):
+    """Poisson arrivals with exponential bursts (an M/M/1 queue at rho=0.9)."""
+    rng = np.random.default_rng(seed)
+    arrival = np.cumsum(rng.exponential(1.0 / rate, n))
+    burst = rng.exponential(mean_burst, n) + 0.01
+    priority = rng.integers(0, 8, n).astype(np.float64)
+    return arrival, burst, priority
+
+
+def heavy_tailed(n, seed=0, rate=1.0, alpha=1.5, min_burst=0.3):
+    """Poisson arrivals with Pareto bursts: mostly short jobs, a few huge ones."""
+    rng = np.random.default_rng(seed)
+    arrival = np.cumsum(rng.exponential(1.0 / rate, n))
+    burst = (rng.pareto(alpha, n) + 1.0) * min_burst
+    priority = rng.integers(0, 8, n).astype(np.float64)
+    return arrival, burst, priority
+
+
+def bursty(n, seed=0, batch_size=1000, gap=500.0):
+    """Batch submissions: groups of batch_size jobs arriving at the same time."""
+    rng = np.random.default_rng(seed)
+    arrival = (np.arange(n) // batch_size).astype(np.float64) * gap
+    burst = rng.integers(1, 100, n).astype(np.float64) / 100.0
+    priority = rng.integers(0, 8, n).astype(np.float64)
+    return arrival, burst, priority
+
+
+def priority_range(n, seed=0, levels=10 ** 6):
+    """Poisson arrivals with priorities drawn from a very large range."""
+    rng = np.random.default_rng(seed)
+    arrival = np.cumsum(rng.exponential(1.0, n))
+    burst = rng.exponential(0.9, n) + 0.01
+    priority = rng.integers(0, levels, n).astype(np.float64)
+    return arrival, burst, priority
+
+
+WORKLOADS = {
+    "poisson": poisson,
+    "heavy_tailed": heavy_tailed,
+    "bursty": bursty,
+    "priority_range": priority_range,
+}
+
+
+def to_processes(arrival, burst, priority):
+    return [
+        {"pid": i, "arrival": a, "burst": b, "priority": p}
+        for i, (a, b, p) in enumerate(zip(arrival.tolist(), burst.tolist(), priority.tolist()))
+    ]
@@ -20,6 +20,53 @@ function addProcessRow() {
 addProcessRow();
 addBtn.addEventListener("click", addProcessRow);
 
+// Columnar binary responses (see api/_columnar.py): a JSON header whose
+// schedules and chart images point into 8-byte aligned little-endian
+// buffers, so they are viewed in place instead of parsed.
+const COLUMNAR_TYPE = "application/x-schedule-columnar";
+const COLUMN_TYPES = { u8: Uint8Array, u16: Uint16Array, i32: Int32Array, f64: Float64Array };
+
+function decodeColumnar(buffer) {
+    const view = new DataView(buffer);
+    const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+    if (magic !== "SCHD" || view.getUint32(4, true) !== 1) {
+        throw new Error("Unsupported columnar response");
+    }
+    const metaLength = view.getUint32(8, true);
+    const meta = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 12, metaLength)));
+    const base = Math.ceil((12 + metaLength) / 8) * 8;
+
+    const revive = (value) => {
+        if (Array.isArray(value)) return value.map(revive);
+        if (value === null || typeof value !== "object") return value;
+        if (value.$columns) {
+            const c = value.$columns;
+            const column = ([offset, type]) => new COLUMN_TYPES[type](buffer, base + offset, c.length);
+            return { length: c.length, pids: c.pids, pid: column(c.pid), start: column(c.start), end: column(c.end) };
+        }
+        if (value.$bytes) {
+            return new Uint8Array(buffer, base + value.$bytes[0], value.$bytes[1]);
+        }
+        const out = {};
+        for (const [key, item] of Object.entries(value)) out[key] = revive(item);
+        return out;
+    };
+    return revive(meta);
+}
+
+async function readResponse(res) {
+    const type = res.headers.get("Content-Type") || "";
+    return type.startsWith(COLUMNAR_TYPE) ? decodeColumnar(await res.arrayBuffer()) : res.json();
+}
+
+function chartSource(algoData) {
+    const type = algoData.gantt_format === "svg" ? "image/svg+xml" : "image/png";
+    if (algoData.gantt_image instanceof Uint8Array) {
+        return URL.createObjectURL(new Blob([algoData.gantt_image], { type }));
+    }
+    return `data:${type};base64,${algoData.gantt_image}`;
+}
+
 document.getElementById("schedule-form").addEventListener("submit", async (e) => {
     e.preventDefault();
 
@@ -40,11 +87,11 @@ document.getElementById("schedule-form").addEventListener("submit", async (e) =>
     try {
         const res = await fetch("/api/schedule", {
             method: "POST",
-            headers: {"Content-Type": "application/json"},
+            headers: {"Content-Type": "application/json", "Accept": `${COLUMNAR_TYPE}, application/json`},
             body: JSON.stringify(payload)
         });
 
-        const data = await res.json();
+        const data = await readResponse(res);
         
         renderAllCharts(data);
 
@@ -60,6 +107,9 @@ function renderAllCharts(data) {
     const summaryBox = document.getElementById("comparison-summary");
     const bestAlgoSpan = document.getElementById("best-algo-name");
 
+    grid.querySelectorAll("img.gantt-img").forEach((img) => {
+        if (img.src.startsWith("blob:")) URL.revokeObjectURL(img.src);
+    });
     grid.innerHTML = ""; 
 
     // Show Best Algorithm
@@ -82,6 +132,9 @@ function renderAllCharts(data) {
         const avgTurn = algoData.stats.avg_turnaround_time !== undefined 
                         ? algoData.stats.avg_turnaround_time.toFixed(2) 
                         : "N/A";
+        const p95Wait = algoData.stats.p95_waiting_time !== undefined 
+                        ? algoData.stats.p95_waiting_time.toFixed(2) 
+                        : "N/A";
 
         card.innerHTML = `
             <div class="algo-header">
@@ -92,10 +145,11 @@ function renderAllCharts(data) {
             <div class="stats-grid">
                 <div><strong>Avg Waiting:</strong> ${avgWait}</div>
                 <div><strong>Avg Turnaround:</strong> ${avgTurn}</div>
+                <div><strong>P95 Waiting:</strong> ${p95Wait}</div>
             </div>
 
             ${algoData.gantt_image 
-                ? `<img src="data:image/png;base64,${algoData.gantt_image}" class="gantt-img" />` 
+                ? `<img src="${chartSource(algoData)}" class="gantt-img" />` 
                 : `<div style="padding:20px; text-align:center; background:#eee;">No Chart</div>`
             }
         `;
@@ -1,127 +1,46 @@
-from typing import List, Dict, Tuple, Any
-import matplotlib
-matplotlib.use("Agg")  # Use non-GUI backend for server environments
-import matplotlib.pyplot as plt
-import io, base64
+from typing import List, Dict, Tuple, Any, Callable, Iterable, Iterator, Optional
+import numpy as np
 
+from schedulers.gantt import generate_fcfs_gantt  # re-exported for existing callers
+from schedulers.kernel import FCFS, run, switch_costs
+from schedulers.result import Schedule, Stats
+from schedulers.vectorized import fcfs_arrays, build_result
 
-def fcfs(processes: List[Dict[str, Any]]) -> Tuple[List[Tuple[Any, float, float]], Dict[Any, Dict[str, float]]]:
+
+def fcfs(processes: List[Dict[str, Any]], switch_cost: float = 0.0, cache_penalty: float = 0.0) -> Tuple[Schedule, Stats]:
     """
     First Come First Serve Scheduling Algorithm
+    Thin dict-based wrapper around the vectorized fcfs_arrays engine: the
+    schedule of schedulers.kernel with the FCFS policy, up to float rounding.
+    Every dispatch costs switch_cost; cache_penalty only applies to resumed
+    (preempted) processes, which FCFS never has.
     Returns:
-        schedule: List of (pid, start_time, end_time)
-        stats: Dictionary of per-process stats + averages
+        schedule: Schedule of (pid, start_time, end_time) segments
+        stats: Stats mapping of per-process stats + averages
     """
 
-    # Defensive copy & type normalization
-    proc_list = [{
-        "pid": p["pid"],
-        "arrival": float(p.get("arrival", 0)),
-        "burst": float(p["burst"])
-    } for p in processes]
-
-    # Sort by arrival time
-    proc_list.sort(key=lambda x: x["arrival"])
-
-    n = len(proc_list)
-    arrival = {p["pid"]: p["arrival"] for p in proc_list}
-    burst = {p["pid"]: p["burst"] for p in proc_list}
-
-    schedule = []       # (pid, start, end)
-    completion = {}
-    time = 0.0          # global clock
-
-    # Build schedule
-    for p in proc_list:
-        pid = p["pid"]
-        at = arrival[pid]
-        bt = burst[pid]
-
-        # CPU idle time
-        if time < at:
-            schedule.append(("IDLE", time, at))
-            time = at
-
-        start = time
-        end = start + bt
-
-        schedule.append((pid, start, end))
-        completion[pid] = end
-
-        time = end
-
-    # -----------------------------
-    #   Calculate Statistics
-    # -----------------------------
-    total_tat = total_wt = 0.0
-    out_stats = {}
+    switch_cost, _ = switch_costs(switch_cost, cache_penalty)
 
-    for p in proc_list:
-        pid = p["pid"]
-        tat = completion[pid] - arrival[pid]      # Turnaround Time
-        wt = tat - burst[pid]                     # Waiting Time
+    # Defensive copy & type normalization into parallel columns
+    pids = [p["pid"] for p in processes]
+    arrival = np.fromiter((float(p.get("arrival", 0)) for p in processes), dtype=np.float64, count=len(pids))
+    burst = np.fromiter((float(p["burst"]) for p in processes), dtype=np.float64, count=len(pids))
+    if not (np.isfinite(arrival).all() and np.isfinite(burst).all()):
+        raise ValueError("arrival and burst must be finite")
 
-        out_stats[pid] = {
-            "arrival": arrival[pid],
-            "burst": burst[pid],
-            "completion": completion[pid],
-            "turnaround": tat,
-            "waiting": wt
-        }
+    order, start, completion = fcfs_arrays(arrival, burst, switch_cost)
+    return build_result(pids, arrival, burst, order, start, completion, switch_cost)
 
-        total_tat += tat
-        total_wt += wt
 
-    out_stats["avg_turnaround_time"] = float(total_tat / n) if n else 0.0
-    out_stats["avg_waiting_time"] = float(total_wt / n) if n else 0.0
-
-    return schedule, out_stats
-
-
-def generate_fcfs_gantt(schedule, title="FCFS Gantt Chart"):
+def iter_fcfs(records: Iterable[Dict[str, Any]],
+              on_complete: Optional[Callable[[Any, float, float, float], None]] = None) -> Iterator[Tuple[Any, float, float]]:
     """
-    Generates a Gantt chart (PNG base64) for FCFS schedule.
+    Streaming FCFS over an arrival-ordered stream of normalized
+    {"pid", "arrival", "burst"} records, for traces too large for fcfs_arrays.
+    Yields (pid, start, end) segments and calls
+    on_complete(pid, arrival, burst, completion) as each process finishes.
     """
-    # Collect PIDs ensuring IDLE appears last
-    pids = []
-    for pid, _, _ in schedule:
-        if pid != "IDLE" and pid not in pids:
-            pids.append(pid)
-    if any(seg[0] == "IDLE" for seg in schedule):
-        pids.append("IDLE")
-
-    y_pos = {pid: idx for idx, pid in enumerate(reversed(pids))}
-    cmap = plt.get_cmap("tab20")
-
-    fig, ax = plt.subplots(figsize=(10, 2 + len(pids) * 0.3))
-
-    # Draw each task bar
-    for idx, (pid, start, end) in enumerate(schedule):
-        color = "#cccccc" if pid == "IDLE" else cmap(idx % 20)
-        ax.barh(
-            y=y_pos[pid],
-            width=end - start,
-            left=start,
-            height=0.6,
-            color=color,
-            edgecolor="black",
-        )
-
-        # Label task inside bar
-        mid = (start + end) / 2
-        if end - start >= 0.5:
-            ax.text(mid, y_pos[pid], pid, ha="center", va="center", fontsize=8)
-
-    ax.set_yticks(list(y_pos.values()))
-    ax.set_yticklabels(list(reversed(pids)))
-    ax.set_xlabel("Time")
-    ax.set_title(title)
-    ax.grid(axis="x", linestyle="--", alpha=0.3)
-
-    # Convert plot to Base64 PNG
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format="png", dpi=150, bbox_inches="tight")
-    plt.close()
-    buffer.seek(0)
+    def finished(job, time):
+        on_complete(job.pid, job.arrival, job.burst, time)
 
-    return base64.b64encode(buffer.getvalue()).decode("utf-8")
+    return run(records, FCFS(), finished if on_complete is not None else None)
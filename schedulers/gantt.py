@@ -0,0 +1,264 @@
+"""
+Gantt chart rendering for every scheduler.
+
+matplotlib is expensive to import, so it is loaded on the first chart request
+rather than when a scheduler module or the API is imported. Simulation-only
+use and serverless cold starts never pay for it.
+
+All charts go through render_gantt:
+  * every bar is drawn by a single PolyCollection instead of one barh()
+    artist per segment;
+  * segments narrower than a pixel are merged into their neighbour;
+  * one Figure/canvas is reused per worker thread instead of a new pyplot
+    figure per request;
+  * very large PNG charts skip matplotlib entirely and are rasterized with
+    NumPy and encoded with zlib.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import io, base64
+import struct
+import threading
+import zlib
+
+import numpy as np
+
+DPI = 150
+WIDTH_IN = 10.0
+MAX_HEIGHT_IN = 32.0
+MAX_TICK_ROWS = 100
+RASTER_THRESHOLD = 50_000   # segments above which PNGs use the raster path
+
+IDLE_COLOR = "#cccccc"
+CS_COLOR = "#444444"
+# Pseudo-processes drawn in their own bottom rows, with fixed colors
+SPECIAL_COLORS = {"CS": (-2, CS_COLOR), "IDLE": (-1, IDLE_COLOR)}
+TAB20 = [
+    "#1f77b4", "#aec7e8", "#ff7f0e", "#ffbb78", "#2ca02c", "#98df8a", "#d62728", "#ff9896",
+    "#9467bd", "#c5b0d5", "#8c564b", "#c49c94", "#e377c2", "#f7b6d2", "#7f7f7f", "#c7c7c7",
+    "#bcbd22", "#dbdb8d", "#17becf", "#9edae5",
+]
+
+_local = threading.local()
+
+
+def _figure():
+    """
+    Returns this thread's cached Figure, cleared. Built on the Agg canvas
+    directly, so pyplot (and its global figure manager) is never imported.
+    """
+    fig = getattr(_local, "figure", None)
+    if fig is None:
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        _local.figure = fig
+    fig.clear()
+    return fig
+
+
+def _columns(schedule: Iterable[Tuple[Any, float, float]]):
+    """
+    Splits a schedule into row order (first appearance, then CS and IDLE)
+    and NumPy columns: row index, start, end and tab20 color index (negative
+    for the SPECIAL_COLORS pseudo-processes).
+    """
+    rows: Dict[Any, int] = {}
+    seg_row: List[int] = []
+    starts: List[float] = []
+    ends: List[float] = []
+    special_seen = set()
+    for pid, start, end in schedule:
+        special = SPECIAL_COLORS.get(pid) if isinstance(pid, str) else None
+        if special is not None:
+            special_seen.add(pid)
+            seg_row.append(special[0])
+        else:
+            row = rows.get(pid)
+            if row is None:
+                row = rows[pid] = len(rows)
+            seg_row.append(row)
+        starts.append(start)
+        ends.append(end)
+
+    pids = list(rows)
+    row_arr = np.asarray(seg_row, dtype=np.int64)
+    color = np.arange(len(row_arr)) % len(TAB20)
+    specials = row_arr < 0
+    color[specials] = row_arr[specials]
+    for name, (code, _) in SPECIAL_COLORS.items():
+        if name in special_seen:
+            row_arr[color == code] = len(pids)
+            pids.append(name)
+
+    return pids, row_arr, np.asarray(starts, dtype=np.float64), np.asarray(ends, dtype=np.float64), color
+
+
+def _downsample(row, start, end, color, px):
+    """
+    Merges each bar narrower than px into the previous kept bar of the same
+    row when the gap between them is also below px. Wide bars are untouched.
+    """
+    if len(row) == 0 or px <= 0:
+        return row, start, end, color
+    order = np.lexsort((start, row))
+    row, start, end, color = row[order], start[order], end[order], color[order]
+
+    keep_row, keep_start, keep_end, keep_color = [], [], [], []
+    for r, s, e, c in zip(row.tolist(), start.tolist(), end.tolist(), color.tolist()):
+        if keep_row and keep_row[-1] == r and e - s < px and s - keep_end[-1] < px:
+            keep_end[-1] = max(keep_end[-1], e)
+            continue
+        keep_row.append(r)
+        keep_start.append(s)
+        keep_end.append(e)
+        keep_color.append(c)
+    return (np.asarray(keep_row), np.asarray(keep_start), np.asarray(keep_end), np.asarray(keep_color))
+
+
+def _encode_png(rgb: np.ndarray) -> bytes:
+    """Minimal 8-bit RGB PNG encoder (zlib-compressed scanlines)."""
+    height, width, _ = rgb.shape
+    raw = np.empty((height, width * 3 + 1), dtype=np.uint8)
+    raw[:, 0] = 0   # filter type: none
+    raw[:, 1:] = rgb.reshape(height, width * 3)
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header)
+            + chunk(b"IDAT", zlib.compress(raw.tobytes(), 6)) + chunk(b"IEND", b""))
+
+
+def _hex_rgb(color: str) -> Tuple[int, int, int]:
+    return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+
+
+def render_raster(schedule: Iterable[Tuple[Any, float, float]], width: int = int(WIDTH_IN * DPI),
+                  max_height: int = 2000) -> bytes:
+    """
+    Renders a schedule straight to PNG bytes with NumPy: one pixel-row band
+    per pid, no axes or text. Cost is linear in segments plus pixels.
+    """
+    pids, row, start, end, color = _columns(schedule)
+    n_rows = max(len(pids), 1)
+    # More pids than pixel rows: several pids share one band
+    bands_n = min(n_rows, max_height - 20)
+    band = int(max(1, min(24, (max_height - 20) // bands_n)))
+    height = 20 + band * bands_n
+
+    t0 = float(start.min()) if len(start) else 0.0
+    t1 = float(end.max()) if len(end) else 1.0
+    scale = width / (t1 - t0) if t1 > t0 else 0.0
+
+    # Per (band, x) palette index: 0 = background, then CS, IDLE, tab20
+    canvas = np.zeros((bands_n, width), dtype=np.uint8)
+    if len(row):
+        x0 = np.clip(((start - t0) * scale).astype(np.int64), 0, width - 1)
+        x1 = np.clip(np.ceil((end - t0) * scale).astype(np.int64), x0 + 1, width)
+        lengths = x1 - x0
+        seg = np.repeat(np.arange(len(row)), lengths)
+        offsets = np.arange(len(seg)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        xs = np.repeat(x0, lengths) + offsets
+        canvas[(row * bands_n // n_rows)[seg], xs] = (color[seg] + 3).astype(np.uint8)
+
+    palette = np.array([(255, 255, 255), _hex_rgb(CS_COLOR), _hex_rgb(IDLE_COLOR)]
+                       + [_hex_rgb(c) for c in TAB20], dtype=np.uint8)
+    # First pid at the top, matching the vector charts; 1px gap between bands
+    image = np.full((height, width, 3), 255, dtype=np.uint8)
+    body = np.repeat(palette[canvas], band, axis=0)
+    if band > 2:
+        body[band - 1::band] = 255
+    image[10:10 + body.shape[0]] = body
+    return _encode_png(image)
+
+
+def render_gantt(schedule: Iterable[Tuple[Any, float, float]], title: str = "Gantt Chart", fmt: str = "png",
+                 label_width: float = 0.5, raster: Optional[bool] = None) -> str:
+    """
+    Renders any scheduler's (pid, start, end) schedule as a base64 PNG or SVG.
+    raster=None picks the NumPy raster path automatically for PNGs with more
+    than RASTER_THRESHOLD segments; True/False forces it on or off.
+    """
+    if raster is None:
+        raster = fmt == "png" and len(schedule) > RASTER_THRESHOLD
+    if raster and fmt == "png":
+        return base64.b64encode(render_raster(schedule)).decode("utf-8")
+
+    pids, row, start, end, color = _columns(schedule)
+    n_rows = len(pids)
+
+    t0 = float(start.min()) if len(start) else 0.0
+    t1 = float(end.max()) if len(end) else 1.0
+    px = (t1 - t0) / (WIDTH_IN * DPI)
+    row, start, end, color = _downsample(row, start, end, color, px)
+
+    # Rows are drawn bottom-up, so the first pid sits at the top
+    y = (n_rows - 1 - row).astype(np.float64)
+    verts = np.empty((len(row), 4, 2))
+    verts[:, 0] = np.column_stack((start, y - 0.3))
+    verts[:, 1] = np.column_stack((start, y + 0.3))
+    verts[:, 2] = np.column_stack((end, y + 0.3))
+    verts[:, 3] = np.column_stack((end, y - 0.3))
+    special = {code: face for code, face in SPECIAL_COLORS.values()}
+    faces = [special[c] if c < 0 else TAB20[c] for c in color.tolist()]
+
+    from matplotlib.collections import PolyCollection
+
+    fig = _figure()
+    fig.set_size_inches(WIDTH_IN, min(MAX_HEIGHT_IN, max(2, 2 + n_rows * 0.3)))
+    ax = fig.add_subplot()
+    ax.set_axisbelow(True)
+    ax.add_collection(PolyCollection(verts, facecolors=faces, edgecolors="black",
+                                     linewidths=1.0 if len(row) <= 2000 else 0.2))
+
+    # Label bars wide enough both in time units and on screen
+    wide = (end - start >= label_width) & (end - start >= 8 * px) & (color != SPECIAL_COLORS["CS"][0])
+    for r, s, e in zip(y[wide].tolist(), start[wide].tolist(), end[wide].tolist()):
+        ax.text((s + e) / 2, r, pids[n_rows - 1 - int(r)], ha="center", va="center", fontsize=8)
+
+    ax.set_xlim(t0 - (t1 - t0) * 0.02, t1 + (t1 - t0) * 0.02 or 1)
+    ax.set_ylim(-0.7, n_rows - 0.3)
+    if n_rows <= MAX_TICK_ROWS:
+        ax.set_yticks(list(range(n_rows)))
+        ax.set_yticklabels([str(p) for p in reversed(pids)])
+    else:
+        ax.set_yticks([])
+        ax.set_ylabel(f"{n_rows} processes")
+    ax.set_xlabel("Time")
+    ax.set_title(title)
+    ax.grid(axis="x", linestyle="--", alpha=0.3)
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=fmt, dpi=DPI, bbox_inches="tight")
+    fig.clear()
+
+    return base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+
+def generate_fcfs_gantt(schedule, title="FCFS Gantt Chart", fmt="png"):
+    """
+    Generates a Gantt chart (base64 PNG or SVG, per fmt) for FCFS schedule.
+    """
+    return render_gantt(schedule, title, fmt, label_width=0.5)
+
+
+def generate_sjf_gantt(schedule: List[Tuple[str, float, float]], title: str = "SJF Gantt Chart", fmt: str = "png") -> str:
+    return render_gantt(schedule, title, fmt, label_width=0.5)
+
+
+def generate_srtf_gantt(schedule: List[Tuple[str, float, float]], title: str = "SRTF Gantt Chart", fmt: str = "png") -> str:
+    return render_gantt(schedule, title, fmt, label_width=0.3)
+
+
+def generate_priority_gantt(schedule: List[Tuple[str, float, float]], title="Preemptive Priority Gantt Chart", fmt: str = "png") -> str:
+    return render_gantt(schedule, title, fmt, label_width=0.5)
+
+
+def generate_gantt_image(schedule: List[Tuple[str, float, float]], title: str = "Round Robin Gantt Chart", fmt: str = "png") -> str:
+    return render_gantt(schedule, title, fmt, label_width=0.4)
+
+
+def generate_mlfq_gantt(schedule: List[Tuple[str, float, float]], title: str = "MLFQ Gantt Chart", fmt: str = "png") -> str:
+    return render_gantt(schedule, title, fmt, label_width=0.4)
@@ -0,0 +1,369 @@
+"""
+Discrete-event kernel shared by the single-CPU schedulers.
+
+run() replays an arrival-ordered stream of normalized process records
+through a ready queue ordered by a Policy and yields one event stream of
+(pid, start, end) segments, "IDLE" gaps and "CS" context switches included,
+calling on_complete(job, completion) as each process finishes. simulate()
+folds that stream into Schedule, Stats, RunningStats and SegmentMetrics in
+a single pass.
+
+Dispatching a process other than the one last loaded on the CPU costs a
+"CS" segment of switch_cost, plus cache_penalty when the process resumes
+after being preempted. A switch is not interruptible; arrivals during it
+are considered once it ends. The mlfq, smp and online engines charge
+switches the same way.
+
+Arrivals come from one ArrivalCursor and the ready queue is a heap keyed by
+the policy, so any policy runs in O(n log n) plus O(1) per segment. Whether
+a run completes is decided by comparing event times, never by an epsilon on
+the remaining time.
+"""
+from typing import List, Dict, Tuple, Any, Callable, Iterable, Iterator, Optional
+import heapq
+import math
+
+from schedulers.metrics import RunningStats, SegmentMetrics
+from schedulers.result import Schedule, Stats
+from schedulers.trace import ArrivalCursor
+
+
+def normalize_processes(processes: Iterable[Dict[str, Any]], keep: Tuple[str, ...] = ()) -> List[Dict[str, Any]]:
+    """
+    Coerces pid to str and times and priority to float, sorted by arrival.
+    Non-finite values are rejected; a NaN burst would never complete. Fields
+    named in keep are copied through as they are.
+    """
+    proc_list = [
+        {
+            "pid": str(p.get("pid")),
+            "arrival": float(p.get("arrival", 0)),
+            "burst": float(p.get("burst", 0)),
+            "priority": float(p.get("priority", 0) or 0),
+            **{name: p.get(name) for name in keep},
+        }
+        for p in processes
+    ]
+    isfinite = math.isfinite
+    for p in proc_list:
+        if not (isfinite(p["arrival"]) and isfinite(p["burst"]) and isfinite(p["priority"])):
+            raise ValueError(f"process {p['pid']}: arrival, burst and priority must be finite")
+    proc_list.sort(key=lambda x: x["arrival"])
+    return proc_list
+
+
+def switch_costs(switch_cost: float, cache_penalty: float) -> Tuple[float, float]:
+    """Coerces the context-switch costs to float, rejecting negative or non-finite ones."""
+    switch_cost, cache_penalty = float(switch_cost), float(cache_penalty)
+    if not (math.isfinite(switch_cost) and switch_cost >= 0):
+        raise ValueError("switch_cost must be finite and non-negative")
+    if not (math.isfinite(cache_penalty) and cache_penalty >= 0):
+        raise ValueError("cache_penalty must be finite and non-negative")
+    return switch_cost, cache_penalty
+
+
+class Job:
+    """
+    A process inside the kernel; index is its position in arrival order.
+    waited is the time spent in the ready queue (or switching in) up to its
+    last dispatch and ready_since when it last entered or left the queue.
+    """
+    __slots__ = ("pid", "arrival", "burst", "priority", "index", "remaining", "waited", "ready_since")
+
+    def __init__(self, record: Dict[str, Any], index: int) -> None:
+        self.pid = record["pid"]
+        self.arrival = record["arrival"]
+        self.burst = record["burst"]
+        self.priority = record.get("priority", 0.0)
+        self.index = index
+        self.remaining = self.burst
+        self.waited = 0.0
+        self.ready_since = self.arrival
+
+
+class Policy:
+    """
+    Ready-queue policy. key(job, seq) orders the ready heap whenever job
+    enters it (seq counts entries, so a key of (seq,) is FIFO). At every
+    arrival a preemptive policy is asked preempts(head, job, key, now):
+    should the entry with key head take the CPU from job, dispatched with
+    key, at time now. If waiting alone can make head win, overtakes(head,
+    job, key) is the time it does, and run() stops there to ask again.
+    rank(job, key, now) places a running job among queued keys, so engines
+    with several CPUs can pick which one to preempt. quantum caps a single
+    dispatch. Only a policy with a positive aging_rate ever overtakes.
+    """
+    name = ""
+    preemptive = False
+    quantum: Optional[float] = None
+    aging_rate = 0.0
+    extra_columns: Tuple[str, ...] = ()
+
+    def key(self, job: Job, seq: int) -> tuple:
+        return (seq,)
+
+    def preempts(self, head: tuple, job: Job, key: tuple, now: float) -> bool:
+        return False
+
+    def overtakes(self, head: tuple, job: Job, key: tuple) -> float:
+        return float("inf")
+
+    def rank(self, job: Job, key: tuple, now: float) -> tuple:
+        return key
+
+    def columns(self, job: Job) -> Tuple[float, ...]:
+        """Values of extra_columns recorded when job completes."""
+        return ()
+
+
+class FCFS(Policy):
+    name = "FCFS"
+
+
+class SJF(Policy):
+    name = "SJF"
+
+    def key(self, job: Job, seq: int) -> tuple:
+        return (job.burst, job.index)
+
+
+class SRTF(Policy):
+    name = "SRTF"
+    preemptive = True
+
+    def key(self, job: Job, seq: int) -> tuple:
+        return (job.remaining, job.arrival, job.pid, seq)
+
+    def preempts(self, head: tuple, job: Job, key: tuple, now: float) -> bool:
+        return head[0] < job.remaining
+
+    def rank(self, job: Job, key: tuple, now: float) -> tuple:
+        return (job.remaining, job.arrival, job.pid)
+
+
+class Priority(Policy):
+    """
+    Preemptive priority, lower value first. A process ages only while it
+    waits: its effective priority is priority - aging_rate * (time spent in
+    the ready queue) and stays frozen while it runs. Everyone in the queue
+    ages at the same rate, so keying it by the effective priority at entry
+    plus aging_rate * entry time orders it at every instant. The head
+    preempts when its key, aged up to now, beats the running process's key
+    as of its dispatch.
+
+    By aging alone, a waiting process takes over once it is a full priority
+    level (margin) ahead of the running one. Without a margin, two long
+    processes at equal effective priority would swap the CPU at every
+    instant.
+    """
+    name = "PRIORITY"
+    preemptive = True
+    extra_columns = ("priority",)
+    margin = 1.0
+
+    def __init__(self, aging_rate: float = 0.0) -> None:
+        self.aging_rate = float(aging_rate)
+
+    def key(self, job: Job, seq: int) -> tuple:
+        rate = self.aging_rate
+        return (job.priority - rate * job.waited + rate * job.ready_since, job.arrival, job.index)
+
+    def preempts(self, head: tuple, job: Job, key: tuple, now: float) -> bool:
+        return head < self.rank(job, key, now)
+
+    def rank(self, job: Job, key: tuple, now: float) -> tuple:
+        return (key[0] + self.aging_rate * (now - job.ready_since),) + key[1:]
+
+    def overtakes(self, head: tuple, job: Job, key: tuple) -> float:
+        rate = self.aging_rate
+        if rate <= 0:
+            return float("inf")
+        return job.ready_since + (head[0] - key[0] + self.margin) / rate
+
+    def columns(self, job: Job) -> Tuple[float, ...]:
+        return (job.priority,)
+
+
+class RoundRobin(Policy):
+    name = "RR"
+
+    def __init__(self, quantum: float) -> None:
+        quantum = float(quantum)
+        if not (math.isfinite(quantum) and quantum > 0):
+            raise ValueError("quantum must be a finite positive number")
+        self.quantum = quantum
+
+
+POLICIES = ("FCFS", "SJF", "SRTF", "PRIORITY", "RR")
+
+
+def make_policy(algorithm: str, quantum: float = 2.0, aging_rate: float = 0.0) -> Policy:
+    """The Policy for one of POLICIES; quantum is used by RR, aging_rate by PRIORITY."""
+    algorithm = str(algorithm).upper()
+    if algorithm == "FCFS":
+        return FCFS()
+    if algorithm == "SJF":
+        return SJF()
+    if algorithm == "SRTF":
+        return SRTF()
+    if algorithm == "PRIORITY":
+        aging_rate = float(aging_rate)
+        if not (math.isfinite(aging_rate) and aging_rate >= 0):
+            raise ValueError("aging_rate must be finite and non-negative")
+        return Priority(aging_rate)
+    if algorithm == "RR":
+        return RoundRobin(quantum)
+    raise ValueError(f"Unknown algorithm: {algorithm}")
+
+
+def run(records: Iterable[Dict[str, Any]], policy: Policy,
+        on_complete: Optional[Callable[[Job, float], None]] = None,
+        switch_cost: float = 0.0, cache_penalty: float = 0.0) -> Iterator[Tuple[str, float, float]]:
+    """
+    Simulates policy over arrival-ordered {"pid", "arrival", "burst"[,
+    "priority"]} records, yielding segments as they are decided. Only the
+    ready heap is held in memory. A time slice that expires puts the
+    process back behind everything that arrived by then.
+    """
+    switch_cost, cache_penalty = switch_costs(switch_cost, cache_penalty)
+    arrivals = ArrivalCursor(records)
+    inf = float("inf")
+    next_arrival = arrivals.peek_arrival() if arrivals else inf
+    ready: List[Tuple[tuple, int, Job]] = []
+    heappush, heappop = heapq.heappush, heapq.heappop
+    key = policy.key
+    preempts = policy.preempts
+    overtakes = policy.overtakes
+    preemptive = policy.preemptive
+    quantum = policy.quantum if policy.quantum is not None else inf
+    time = 0.0
+    seq = 0
+    admitted = 0
+    current: Optional[Job] = None
+    current_key = ()
+    seg_start = 0.0
+    budget = quantum    # left of the current dispatch's time slice
+    loaded = None
+
+    def admit() -> None:
+        nonlocal seq, admitted, next_arrival
+        while next_arrival <= time:
+            job = Job(arrivals.pop(), admitted)
+            admitted += 1
+            heappush(ready, (key(job, seq), seq, job))
+            seq += 1
+            next_arrival = arrivals.peek_arrival() if arrivals else inf
+
+    def requeue(job: Job) -> None:
+        nonlocal seq
+        job.ready_since = time
+        heappush(ready, (key(job, seq), seq, job))
+        seq += 1
+
+    while next_arrival < inf or ready or current is not None:
+        if next_arrival <= time:
+            admit()
+
+        if current is None:
+            if not ready:
+                if next_arrival < inf:
+                    yield ("IDLE", time, next_arrival)
+                    time = next_arrival
+                    continue
+                break
+            current_key, _, current = heappop(ready)
+            current.waited += time - current.ready_since
+            current.ready_since = time
+            seg_start = time
+            budget = quantum
+        elif preemptive and ready and preempts(ready[0][0], current, current_key, time):
+            if time > seg_start:
+                yield (current.pid, seg_start, time)
+            requeue(current)
+            current_key, _, current = heappop(ready)
+            current.waited += time - current.ready_since
+            current.ready_since = time
+            seg_start = time
+            budget = quantum
+
+        if current.pid != loaded:
+            loaded = current.pid
+            cost = switch_cost + (cache_penalty if current.remaining < current.burst else 0.0)
+            if cost > 0:
+                yield ("CS", time, time + cost)
+                time += cost
+                seg_start = time
+                # the incoming process ages through its own switch like the rest
+                current.waited += cost
+                current.ready_since = time
+                # admit arrivals that came in during the switch first
+                continue
+
+        finishes = current.remaining <= budget
+        end = time + (current.remaining if finishes else budget)
+        stop = next_arrival
+        if preemptive and ready:
+            stop = min(stop, overtakes(ready[0][0], current, current_key))
+        if preemptive and end > stop:
+            # run up to the arrival (or the head aging past), then reconsider
+            current.remaining -= stop - time
+            budget -= stop - time
+            time = stop
+            continue
+
+        time = end
+        yield (current.pid, seg_start, time)
+        if finishes:
+            current.remaining = 0.0
+            if on_complete is not None:
+                on_complete(current, time)
+        else:
+            current.remaining -= budget
+            if next_arrival <= time:
+                admit()
+            requeue(current)
+        current = None
+
+
+def simulate(processes: Iterable[Dict[str, Any]], policy: Policy, switch_cost: float = 0.0,
+             cache_penalty: float = 0.0, on_complete: Optional[Callable[[Job, float], None]] = None,
+             presorted: bool = False) -> Tuple[Schedule, Stats]:
+    """
+    Runs policy over processes and returns (Schedule, Stats) with the
+    summary metrics every scheduler reports. on_complete, if given, also
+    sees each completion (for policy-specific summaries). With
+    presorted=True, processes must already be normalized and sorted.
+    """
+    switch_cost, cache_penalty = switch_costs(switch_cost, cache_penalty)
+    proc_list = processes if presorted else normalize_processes(processes)
+
+    schedule = Schedule()
+
+    # Stats accumulate as each process completes; no second pass
+    stats = Stats(extra_columns=policy.extra_columns)
+    running = RunningStats()
+    metrics = SegmentMetrics()
+
+    columns = policy.columns
+    extra = [stats.extra[name] for name in policy.extra_columns]
+    add, record, complete = stats.add, running.record, metrics.complete
+
+    def record_completion(job: Job, time: float) -> None:
+        add(job.pid, job.arrival, job.burst, time)
+        if extra:
+            for column, value in zip(extra, columns(job)):
+                column.append(value)
+        record(job.arrival, job.burst, time)
+        complete(job.pid, job.arrival, time)
+        if on_complete is not None:
+            on_complete(job, time)
+
+    append, observe = schedule.append, metrics.observe
+    for pid, start, end in run(proc_list, policy, record_completion, switch_cost, cache_penalty):
+        append(pid, start, end)
+        observe(pid, start, end)
+
+    stats.summary.update(running.summary())
+    stats.summary.update(metrics.summary())
+
+    return schedule, stats
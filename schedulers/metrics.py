@@ -0,0 +1,240 @@
+import math
+from typing import Dict, Iterable, List, Optional
+
+
+class QuantileSketch:
+    """
+    Mergeable streaming quantile sketch with relative error guarantees
+    (DDSketch-style logarithmic buckets).
+
+    Every value v > 0 lands in bucket ceil(log_gamma(v)), so any reported
+    quantile is within relative_accuracy of a true sample value while memory
+    stays O(log(max / min)) regardless of how many values are added. Values
+    at or below zero share a single bucket, which covers the common case of
+    processes that never wait.
+
+    Quantiles use the nearest-rank definition (the ceil(q * n)-th smallest
+    value). Up to EXACT_LIMIT values are also kept verbatim, so small
+    workloads report exact quantiles.
+    """
+    __slots__ = ("relative_accuracy", "_gamma", "_log_gamma", "bins", "zero_count", "count", "min", "max",
+                 "_exact")
+
+    MIN_VALUE = 1e-9
+    EXACT_LIMIT = 128
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._exact: Optional[List[float]] = []
+
+    def _keep_exact(self, values: List[float]) -> None:
+        if self._exact is not None:
+            if len(self._exact) + len(values) <= self.EXACT_LIMIT:
+                self._exact.extend(values)
+            else:
+                self._exact = None
+
+    def add(self, value: float, n: int = 1) -> None:
+        if self._exact is not None:
+            self._keep_exact([value] * n)
+        self.count += n
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if value <= self.MIN_VALUE:
+            self.zero_count += n
+        else:
+            k = math.ceil(math.log(value) / self._log_gamma)
+            self.bins[k] = self.bins.get(k, 0) + n
+
+    def extend(self, values: Iterable[float]) -> None:
+        """
+        Adds many values; NumPy arrays are bucketed in one vectorized pass.
+        """
+        if hasattr(values, "dtype"):
+            import numpy as np
+
+            if not len(values):
+                return
+            self._keep_exact(values.tolist() if len(values) <= self.EXACT_LIMIT else values)
+            self.count += int(len(values))
+            self.min = min(self.min, float(values.min()))
+            self.max = max(self.max, float(values.max()))
+            positive = values[values > self.MIN_VALUE]
+            self.zero_count += int(len(values) - len(positive))
+            keys, counts = np.unique(np.ceil(np.log(positive) / self._log_gamma).astype(np.int64), return_counts=True)
+            for k, c in zip(keys.tolist(), counts.tolist()):
+                self.bins[k] = self.bins.get(k, 0) + c
+            return
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Can only merge sketches with the same relative accuracy")
+        if other._exact is None:
+            self._exact = None
+        else:
+            self._keep_exact(other._exact)
+        self.count += other.count
+        self.zero_count += other.zero_count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        for k, c in other.bins.items():
+            self.bins[k] = self.bins.get(k, 0) + c
+
+    def quantile(self, q: float) -> float:
+        if self.count == 0:
+            return 0.0
+        rank = min(max(math.ceil(q * self.count), 1), self.count)
+        if self._exact is not None:
+            return float(sorted(self._exact)[rank - 1])
+        if rank <= self.zero_count:
+            return max(self.min, 0.0)
+        if rank == self.count:
+            return self.max
+        seen = self.zero_count
+        for k in sorted(self.bins):
+            seen += self.bins[k]
+            if seen >= rank:
+                value = 2 * self._gamma ** k / (self._gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+
+class RunningStats:
+    """
+    Aggregate turnaround/waiting metrics accumulated one completion at a time:
+    running sums plus p50/p95/p99 sketches, with no per-process state kept.
+    Fairness is Jain's index over each process's burst / turnaround (1.0
+    when every process is slowed down equally).
+    """
+    __slots__ = ("count", "total_turnaround", "total_waiting", "turnaround", "waiting",
+                 "_share", "_share_sq")
+
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        self.count = 0
+        self.total_turnaround = 0.0
+        self.total_waiting = 0.0
+        self.turnaround = QuantileSketch(relative_accuracy)
+        self.waiting = QuantileSketch(relative_accuracy)
+        self._share = 0.0
+        self._share_sq = 0.0
+
+    def record(self, arrival: float, burst: float, completion: float) -> None:
+        tat = completion - arrival
+        wt = tat - burst
+        self.count += 1
+        self.total_turnaround += tat
+        self.total_waiting += wt
+        self.turnaround.add(tat)
+        self.waiting.add(wt)
+        share = burst / tat if tat > 0 else 1.0
+        self._share += share
+        self._share_sq += share * share
+
+    def record_arrays(self, turnaround, waiting) -> None:
+        """Bulk variant for the NumPy engines."""
+        import numpy as np
+        self.count += int(len(turnaround))
+        self.total_turnaround += float(turnaround.sum())
+        self.total_waiting += float(waiting.sum())
+        self.turnaround.extend(turnaround)
+        self.waiting.extend(waiting)
+        positive = turnaround > 0
+        share = np.ones(len(turnaround))
+        share[positive] = (turnaround[positive] - waiting[positive]) / turnaround[positive]
+        self._share += float(share.sum())
+        self._share_sq += float((share * share).sum())
+
+    def merge(self, other: "RunningStats") -> None:
+        self.count += other.count
+        self.total_turnaround += other.total_turnaround
+        self.total_waiting += other.total_waiting
+        self.turnaround.merge(other.turnaround)
+        self.waiting.merge(other.waiting)
+        self._share += other._share
+        self._share_sq += other._share_sq
+
+    def summary(self) -> Dict[str, float]:
+        n = self.count
+        out = {
+            "avg_turnaround_time": float(self.total_turnaround / n) if n else 0.0,
+            "avg_waiting_time": float(self.total_waiting / n) if n else 0.0,
+            "fairness_index": self._share ** 2 / (n * self._share_sq) if n and self._share_sq else 1.0,
+        }
+        for p in self.PERCENTILES:
+            out[f"p{p}_waiting_time"] = self.waiting.quantile(p / 100)
+            out[f"p{p}_turnaround_time"] = self.turnaround.quantile(p / 100)
+        return out
+
+
+def dispatch_summary(completed: int, switches: int, overhead: float, busy: float,
+                     makespan: float, response_total: float) -> Dict[str, float]:
+    """
+    Throughput (completions per unit time), CPU utilization (non-IDLE time,
+    switches included, over the makespan from t=0), mean first-response time
+    and context-switch totals.
+    """
+    return {
+        "context_switches": float(switches),
+        "switch_overhead_time": float(overhead),
+        "makespan": float(makespan),
+        "throughput": completed / makespan if makespan > 0 else 0.0,
+        "cpu_utilization": (busy + overhead) / makespan if makespan > 0 else 0.0,
+        "avg_response_time": response_total / completed if completed else 0.0,
+    }
+
+
+class SegmentMetrics:
+    """
+    Single-pass metrics over a (pid, start, end) segment stream, fed as the
+    scheduler emits it. A context switch is every dispatch of a process
+    other than the one last loaded on the CPU (the first dispatch included,
+    since it pays dispatch latency too); time in "CS" segments is the switch
+    overhead. First-run times are held only until the process completes.
+    """
+    __slots__ = ("switches", "overhead", "busy", "makespan", "completed", "response_total",
+                 "_loaded", "_first_start")
+
+    def __init__(self) -> None:
+        self.switches = 0
+        self.overhead = 0.0
+        self.busy = 0.0
+        self.makespan = 0.0
+        self.completed = 0
+        self.response_total = 0.0
+        self._loaded = None
+        self._first_start: Dict[object, float] = {}
+
+    def observe(self, pid, start: float, end: float) -> None:
+        if end > self.makespan:
+            self.makespan = end
+        if pid == "CS":
+            self.overhead += end - start
+        elif pid != "IDLE":
+            self.busy += end - start
+            if pid != self._loaded:
+                self.switches += 1
+                self._loaded = pid
+            if pid not in self._first_start:
+                self._first_start[pid] = start
+
+    def complete(self, pid, arrival: float, completion: float) -> None:
+        """Call once per finished process (zero-burst ones never run)."""
+        self.completed += 1
+        self.response_total += self._first_start.pop(pid, completion) - arrival
+
+    def summary(self) -> Dict[str, float]:
+        return dispatch_summary(self.completed, self.switches, self.overhead, self.busy,
+                                self.makespan, self.response_total)
@@ -0,0 +1,152 @@
+from collections import deque
+from typing import List, Dict, Tuple, Any, Optional
+import math
+
+from schedulers.kernel import normalize_processes, switch_costs
+from schedulers.metrics import RunningStats, SegmentMetrics
+from schedulers.result import Schedule, Stats
+
+def mlfq(processes: List[Dict[str, Any]], quantum: float = 2.0, levels: int = 3,
+         boost_interval: Optional[float] = None, switch_cost: float = 0.0,
+         cache_penalty: float = 0.0) -> Tuple[Schedule, Stats]:
+    """
+    Multilevel feedback queue: levels round robin queues, level k with
+    quantum * 2**k. New processes enter level 0. A process that uses its
+    whole quantum at a level (across preemptions) drops one level. Work
+    arriving at level 0 preempts a running lower-level process. Every
+    boost_interval (default 10x the largest quantum, 0 disables) everything
+    returns to level 0 so long jobs cannot starve. Context switches are
+    charged as in schedulers.kernel.
+    """
+    quantum = float(quantum)
+    levels = int(levels)
+    if not (math.isfinite(quantum) and quantum > 0):
+        raise ValueError("quantum must be a finite positive number")
+    if levels < 1:
+        raise ValueError("levels must be at least 1")
+    quanta = [quantum * 2 ** k for k in range(levels)]
+    if boost_interval is None:
+        boost_interval = 10 * quanta[-1]
+    boost_interval = float(boost_interval)
+    if not (math.isfinite(boost_interval) and boost_interval >= 0):
+        raise ValueError("boost_interval must be a finite non-negative number")
+    switch_cost, cache_penalty = switch_costs(switch_cost, cache_penalty)
+
+    proc_list = normalize_processes(processes)
+    n = len(proc_list)
+
+    schedule = Schedule()
+    stats = Stats(extra_columns=("level", "response_time"))
+    running = RunningStats()
+    metrics = SegmentMetrics()
+    demotions = 0
+    boosts = 0
+    loaded = None
+
+    def emit(pid: str, start_t: float, end_t: float) -> None:
+        metrics.observe(pid, start_t, end_t)
+        if schedule.last_pid() == pid and schedule.end[-1] == start_t:
+            schedule.extend_last(end_t)
+        else:
+            schedule.append(pid, start_t, end_t)
+
+    # One deque per level; entries are [pid, arrival, burst, remaining,
+    # level, used quantum at this level, first start]
+    queues = [deque() for _ in quanta]
+    time = 0.0
+    next_boost = boost_interval if boost_interval > 0 else float("inf")
+    i = 0
+
+    def admit() -> None:
+        nonlocal i
+        while i < n and proc_list[i]["arrival"] <= time:
+            p = proc_list[i]
+            queues[0].append([p["pid"], p["arrival"], p["burst"], p["burst"], 0, 0.0, None])
+            i += 1
+
+    def boost() -> None:
+        nonlocal next_boost, boosts
+        if any(queues[1:]):
+            boosts += 1
+            for q in queues[1:]:
+                while q:
+                    entry = q.popleft()
+                    entry[4] = 0
+                    entry[5] = 0.0
+                    queues[0].append(entry)
+        while next_boost <= time:
+            next_boost += boost_interval
+
+    admit()
+
+    while i < n or any(queues):
+        if time >= next_boost:
+            boost()
+
+        level = next((k for k, q in enumerate(queues) if q), None)
+        if level is None:
+            # CPU is idle: jump straight to the next arrival
+            next_arrival = proc_list[i]["arrival"]
+            schedule.append("IDLE", time, next_arrival)
+            time = next_arrival
+            admit()
+            continue
+
+        entry = queues[level].popleft()
+        if entry[0] != loaded:
+            loaded = entry[0]
+            cost = switch_cost + (cache_penalty if entry[6] is not None else 0.0)
+            if cost > 0:
+                emit("CS", time, time + cost)
+                time += cost
+                admit()
+                if level > 0 and (queues[0] or time >= next_boost):
+                    # new level-0 work or a boost arrived during the switch
+                    queues[level].appendleft(entry)
+                    continue
+        if entry[6] is None:
+            entry[6] = time
+
+        slice_left = quanta[level] - entry[5]
+        finishes = entry[3] <= slice_left
+        run_end = time + (entry[3] if finishes else slice_left)
+
+        # Lower levels yield to new level-0 work and to the next boost
+        stop = run_end
+        if level > 0:
+            if i < n and proc_list[i]["arrival"] < stop:
+                stop = proc_list[i]["arrival"]
+            if next_boost < stop:
+                stop = next_boost
+
+        if stop > time:
+            emit(entry[0], time, stop)
+        entry[3] -= stop - time
+        entry[5] += stop - time
+        time = stop
+        admit()
+
+        if stop == run_end and finishes:
+            entry[3] = 0.0
+            stats.add(entry[0], entry[1], entry[2], time, level=entry[4], response_time=entry[6] - entry[1])
+            running.record(entry[1], entry[2], time)
+            metrics.complete(entry[0], entry[1], time)
+        elif stop == run_end:
+            # used its whole quantum: demote behind the new arrivals
+            if level + 1 < levels:
+                entry[4] = level + 1
+                demotions += 1
+            entry[5] = 0.0
+            queues[entry[4]].append(entry)
+        else:
+            # preempted: resume first at its level with the rest of its quantum
+            queues[level].appendleft(entry)
+
+    stats.summary.update(running.summary())
+    stats.summary.update(metrics.summary())
+    stats.summary.update({
+        "demotions": float(demotions),
+        "boosts": float(boosts),
+    })
+
+    return schedule, stats
@@ -0,0 +1,364 @@
+"""
+Online (open-loop) scheduling: a simulation that keeps running between calls.
+
+OnlineScheduler holds the whole engine state (clock, event heap, ready
+queue, device queues and running metrics), so clients can submit processes
+as they arrive and advance the clock only as far as they need. Each arrival,
+dispatch, block or wakeup costs O(log n); status() reads counters and the
+metric sketches without re-simulating anything.
+
+Processes use the burst format of schedulers.io_bursts: a single "burst" or
+alternating CPU/I-O "bursts".
+"""
+from collections import deque
+from typing import List, Dict, Tuple, Any
+import heapq
+import math
+
+from schedulers.kernel import Job, POLICIES, make_policy, switch_costs
+from schedulers.metrics import RunningStats, SegmentMetrics, dispatch_summary
+from schedulers.result import Schedule, Stats
+
+DEFAULT_DEVICE = "io"
+
+_CPU, _DEVICE, _SWITCH, _CHECK = 0, 1, 2, 3
+
+
+def parse_bursts(p: Dict[str, Any]) -> Tuple[List[float], List[str]]:
+    """
+    Returns (durations, devices) for one process; devices[k] names the device
+    of I/O burst k (durations[2k + 1]).
+    """
+    raw = p.get("bursts")
+    if raw is None:
+        raw = [p.get("burst", 0)]
+    if not isinstance(raw, (list, tuple)) or not raw:
+        raise ValueError(f"process {p.get('pid')}: bursts must be a non-empty list")
+    durations: List[float] = []
+    devices: List[str] = []
+    for k, b in enumerate(raw):
+        if k % 2:
+            if isinstance(b, dict):
+                devices.append(str(b.get("device") or DEFAULT_DEVICE))
+                b = b.get("duration", 0)
+            else:
+                devices.append(DEFAULT_DEVICE)
+        elif isinstance(b, dict):
+            raise ValueError(f"process {p.get('pid')}: burst {k} must be a CPU burst")
+        b = float(b)
+        if not (math.isfinite(b) and b >= 0):
+            raise ValueError(f"process {p.get('pid')}: burst durations must be finite and non-negative")
+        durations.append(b)
+    return durations, devices
+
+
+class OnlineScheduler:
+    """
+    One CPU plus FIFO I/O devices under FCFS, SJF (next CPU burst), SRTF,
+    preemptive PRIORITY or RR, ordered by the kernel policies and paying
+    the kernel's context switch costs. Submit processes with submit(), move
+    the clock with advance(until) or drain(), and read status() at any
+    point. Events at exactly `until` are processed by advance(until).
+    """
+
+    def __init__(self, algorithm: str = "FCFS", quantum: float = 2.0, aging_rate: float = 0.0,
+                 switch_cost: float = 0.0, cache_penalty: float = 0.0) -> None:
+        policy = make_policy(algorithm, quantum, aging_rate)
+        self.algorithm = policy.name
+        self.quantum = float(quantum)
+        self.switch_cost, self.cache_penalty = switch_costs(switch_cost, cache_penalty)
+        self._policy = policy
+        self._slice = policy.quantum if policy.quantum is not None else float("inf")
+        self.now = 0.0
+
+        # Per-process state, indexed by submission order; a Job's burst and
+        # remaining describe its current burst
+        self._jobs: List[Job] = []
+        self._durations: List[List[float]] = []
+        self._devices: List[List[str]] = []
+        self._phase: List[int] = []         # index into durations
+        self._ready_wait: List[float] = []
+        self._ready_wait_total = 0.0
+
+        self.schedule = Schedule()
+        self.stats = Stats(extra_columns=("cpu_time", "io_time", "ready_wait"))
+        self._running_stats = RunningStats()
+        self._metrics = SegmentMetrics()
+        self.device_schedules: Dict[str, Schedule] = {}
+        self._device_queue: Dict[str, deque] = {}
+        self._device_busy: Dict[str, float] = {}
+        self._device_current: Dict[str, int] = {}
+        self._device_end = 0.0
+
+        # (time, kind, tag, version): CPU, switch and aging-check events carry
+        # the CPU version so a preempted run's events are skipped; device
+        # events carry the device name
+        self._events: List[Tuple[float, int, Any, int]] = []
+        self._pending: List[Tuple[float, int]] = []   # future arrivals
+        self._ready: List[Tuple[tuple, int, int]] = []  # (policy key, seq, process)
+        self._seq = 0
+        self._current = -1
+        self._current_key: tuple = ()
+        self._seg_start = 0.0       # after the context switch, if any
+        self._synced = 0.0          # remaining is accounted up to here
+        self._finishes = False      # the current run ends its CPU burst
+        self._version = 0
+        self._loaded = -1
+        self._checked = float("inf")
+        self._free_since = 0.0
+
+    # -- submission -------------------------------------------------------
+
+    def submit(self, process: Dict[str, Any]) -> None:
+        """
+        Adds one process. A missing arrival means now; arrivals in the past
+        are rejected because the engine has already simulated that time.
+        """
+        arrival = process.get("arrival")
+        arrival = self.now if arrival is None else float(arrival)
+        priority = float(process.get("priority", 0) or 0)
+        if not (math.isfinite(arrival) and math.isfinite(priority)):
+            raise ValueError(f"process {process.get('pid')}: arrival and priority must be finite")
+        if arrival < self.now:
+            raise ValueError(f"process {process.get('pid')}: arrival {arrival:g} is before the current time {self.now:g}")
+        durations, devices = parse_bursts(process)
+        for device in devices:
+            if device not in self._device_queue:
+                self.device_schedules[device] = Schedule()
+                self._device_queue[device] = deque()
+                self._device_busy[device] = 0.0
+        j = len(self._jobs)
+        record = {"pid": str(process.get("pid", j)), "arrival": arrival, "burst": durations[0], "priority": priority}
+        self._jobs.append(Job(record, j))
+        self._durations.append(durations)
+        self._devices.append(devices)
+        self._phase.append(0)
+        self._ready_wait.append(0.0)
+        heapq.heappush(self._pending, (arrival, j))
+
+    # -- clock ------------------------------------------------------------
+
+    def next_event_time(self) -> float:
+        t = self._events[0][0] if self._events else float("inf")
+        if self._pending and self._pending[0][0] < t:
+            t = self._pending[0][0]
+        return t
+
+    def advance(self, until: float) -> None:
+        """Simulates every event up to and including time until."""
+        until = float(until)
+        while True:
+            t = self.next_event_time()
+            if t > until:
+                break
+            self._step(t)
+        self.now = max(self.now, until)
+
+    def drain(self) -> None:
+        """Runs until every submitted process has completed."""
+        while self._events or self._pending:
+            self._step(self.next_event_time())
+
+    # -- queries ----------------------------------------------------------
+
+    def summary(self) -> Dict[str, float]:
+        summary = self._running_stats.summary()
+        m = self._metrics
+        makespan = max(m.makespan, self._device_end)
+        summary.update(dispatch_summary(m.completed, m.switches, m.overhead, m.busy, makespan, m.response_total))
+        summary["avg_ready_waiting_time"] = self._ready_wait_total / m.completed if m.completed else 0.0
+        for name, busy in sorted(self._device_busy.items()):
+            summary[f"device_utilization_{name}"] = busy / makespan if makespan > 0 else 0.0
+        return summary
+
+    def status(self) -> Dict[str, Any]:
+        """Current clock, queue depths and aggregate metrics."""
+        return {
+            "algorithm": self.algorithm,
+            "time": self.now,
+            "running": self._jobs[self._current].pid if self._current >= 0 else None,
+            "queue_depth": len(self._ready),
+            "device_queue_depth": {
+                name: len(q) + (name in self._device_current) for name, q in sorted(self._device_queue.items())
+            },
+            "pending": len(self._pending),
+            "submitted": len(self._jobs),
+            "completed": len(self.stats.pids),
+            "metrics": self.summary(),
+        }
+
+    # -- engine -----------------------------------------------------------
+
+    def _make_ready(self, j: int, t: float) -> None:
+        job = self._jobs[j]
+        if job.remaining <= 0:
+            self._advance_process(j, t)   # a zero-length CPU burst needs no CPU
+            return
+        job.ready_since = t
+        heapq.heappush(self._ready, (self._policy.key(job, self._seq), self._seq, j))
+        self._seq += 1
+
+    def _finish(self, j: int, t: float) -> None:
+        d = self._durations[j]
+        cpu = sum(d[0::2])
+        io = sum(d[1::2])
+        job = self._jobs[j]
+        self.stats.add(job.pid, job.arrival, cpu + io, t, cpu_time=cpu, io_time=io,
+                       ready_wait=self._ready_wait[j])
+        self._running_stats.record(job.arrival, cpu + io, t)
+        self._ready_wait_total += self._ready_wait[j]
+        self._metrics.complete(job.pid, job.arrival, t)
+
+    def _advance_process(self, j: int, t: float) -> None:
+        """Moves j past its finished burst: block, wake up or complete."""
+        self._phase[j] += 1
+        k = self._phase[j]
+        durations = self._durations[j]
+        if k >= len(durations):
+            self._finish(j, t)
+            return
+        job = self._jobs[j]
+        job.burst = job.remaining = durations[k]
+        if k % 2 == 0:
+            self._make_ready(j, t)
+            return
+        device = self._devices[j][k // 2]
+        self._device_queue[device].append(j)
+        if device not in self._device_current:
+            self._start_device(device, t)
+
+    def _start_device(self, device: str, t: float) -> None:
+        j = self._device_queue[device].popleft()
+        self._device_current[device] = j
+        end = t + self._jobs[j].remaining
+        heapq.heappush(self._events, (end, _DEVICE, device, 0))
+        if end > t:
+            self.device_schedules[device].append(self._jobs[j].pid, t, end)
+            self._device_busy[device] += end - t
+            self._device_end = max(self._device_end, end)
+
+    def _start_cpu(self, j: int, key: tuple, t: float) -> None:
+        if t > self._free_since:
+            self.schedule.append("IDLE", self._free_since, t)
+        job = self._jobs[j]
+        self._ready_wait[j] += t - job.ready_since
+        job.waited += t - job.ready_since
+        job.ready_since = self._seg_start = self._synced = t
+        self._current = j
+        self._current_key = key
+        self._checked = float("inf")
+        self._version += 1
+        if self._loaded != j:
+            self._loaded = j
+            cost = self.switch_cost + (self.cache_penalty if job.remaining < job.burst else 0.0)
+            if cost > 0:
+                self.schedule.append("CS", t, t + cost)
+                self._metrics.observe("CS", t, t + cost)
+                # as in the kernel, the incoming process ages through its switch
+                job.waited += cost
+                job.ready_since = self._seg_start = self._synced = t + cost
+                heapq.heappush(self._events, (t + cost, _SWITCH, None, self._version))
+                return
+        self._begin_run(t)
+
+    def _begin_run(self, t: float) -> None:
+        remaining = self._jobs[self._current].remaining
+        self._finishes = remaining <= self._slice
+        length = remaining if self._finishes else self._slice
+        heapq.heappush(self._events, (t + length, _CPU, None, self._version))
+
+    def _sync(self, t: float) -> None:
+        self._jobs[self._current].remaining -= t - self._synced
+        self._synced = t
+
+    def _stop_cpu(self, t: float, ran: bool = False) -> int:
+        j = self._current
+        job = self._jobs[j]
+        s = self._seg_start
+        if t > s or ran:
+            # a run that ended on its own counts even at zero length
+            self._metrics.observe(job.pid, s, t)
+        if t > s:
+            if self.schedule.last_pid() == job.pid and self.schedule.end[-1] == s:
+                self.schedule.extend_last(t)
+            else:
+                self.schedule.append(job.pid, s, t)
+        if ran and not self._finishes:
+            job.remaining -= self._slice    # a whole slice, counted as the kernel does
+        else:
+            self._sync(t)
+        self._current = -1
+        self._version += 1
+        self._free_since = t
+        return j
+
+    def _step(self, t: float) -> None:
+        """Processes everything that happens at time t."""
+        self.now = max(self.now, t)
+        events = self._events
+
+        # CPU events, then device completions, then arrivals at t; a switch
+        # ending or an aging check comes last
+        expired = -1
+        switched = -1
+        checked = False
+        entered = self._seq
+        while events and events[0][0] <= t:
+            _, kind, device, ver = heapq.heappop(events)
+            if kind == _DEVICE:
+                j = self._device_current.pop(device)
+                self._jobs[j].remaining = 0.0
+                self._advance_process(j, t)
+                if self._device_queue[device] and device not in self._device_current:
+                    self._start_device(device, t)
+                continue
+            if ver != self._version:
+                continue
+            if kind == _SWITCH:
+                switched = ver
+                checked = True
+            elif kind == _CHECK:
+                self._checked = float("inf")
+                checked = True
+            else:
+                finishes = self._finishes
+                j = self._stop_cpu(t, True)
+                if finishes:
+                    self._jobs[j].remaining = 0.0
+                    self._advance_process(j, t)
+                else:
+                    expired = j
+
+        while self._pending and self._pending[0][0] <= t:
+            self._make_ready(heapq.heappop(self._pending)[1], t)
+
+        # Round robin: a sliced process rejoins behind arrivals and wakeups
+        if expired >= 0:
+            self._make_ready(expired, t)
+
+        ready = self._ready
+        policy = self._policy
+        if self._current < 0:
+            if ready:
+                key, _, j = heapq.heappop(ready)
+                self._start_cpu(j, key, t)
+        elif policy.preemptive and ready and (checked or self._seq != entered) and self._seg_start <= t:
+            # asked on arrivals and wakeups, as a switch ends and as the head
+            # ages past; a context switch is not interruptible
+            self._sync(t)
+            if policy.preempts(ready[0][0], self._jobs[self._current], self._current_key, t):
+                self._make_ready(self._stop_cpu(t), t)
+                key, _, j = heapq.heappop(ready)
+                self._start_cpu(j, key, t)
+
+        # A switch that was not preempted as it ended starts its run
+        if switched == self._version:
+            self._begin_run(t)
+
+        # With aging, the head of the queue can overtake the running process
+        # without any event; schedule a check for when it does
+        if policy.aging_rate > 0 and self._current >= 0 and ready:
+            tx = policy.overtakes(ready[0][0], self._jobs[self._current], self._current_key)
+            if t < tx < self._checked:
+                self._checked = tx
+                heapq.heappush(events, (tx, _CHECK, None, self._version))
@@ -1,148 +1,63 @@
-from typing import List, Dict, Tuple, Any
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
-import io, base64
-
-def priority_scheduling(processes: List[Dict[str, Any]]) -> Tuple[List[Tuple[str, float, float]], Dict[str, Any]]:
-    # Normalize input: pid as str, others as float
-    proc_list = [
-        {
-            "pid": str(p["pid"]),
-            "arrival": float(p["arrival"]),
-            "burst": float(p["burst"]),
-            "priority": float(p["priority"])
-        }
-        for p in processes
-    ]
-
-    # Sort by arrival to help with initial checks
-    proc_list.sort(key=lambda x: x["arrival"])
-
+from typing import List, Dict, Tuple, Any, Optional
+
+from schedulers.gantt import generate_priority_gantt  # re-exported for existing callers
+from schedulers.kernel import Priority, normalize_processes, simulate
+from schedulers.result import Schedule, Stats
+
+MAX_PRIORITY_CLASSES = 64     # per-class starvation keys are skipped beyond this
+
+
+def priority_scheduling(processes: List[Dict[str, Any]], aging_rate: float = 0.0,
+                        starvation_threshold: Optional[float] = None, switch_cost: float = 0.0,
+                        cache_penalty: float = 0.0) -> Tuple[Schedule, Stats]:
+    """
+    Preemptive priority scheduling (lower value runs first) with optional
+    aging: a process's effective priority is priority - aging_rate * (time
+    spent waiting in the ready queue), frozen while it runs. Everyone in the
+    queue ages at the same rate, so the heap orders it at every instant and
+    nothing is ever rescanned. A waiting process eventually outranks every
+    newer arrival, which bounds starvation.
+
+    The summary reports max waiting time and the number of processes that
+    waited longer than starvation_threshold (default: 10x the mean burst),
+    overall and per priority class.
+
+    A waiting process preempts the running one once aging puts it a full
+    priority level ahead; with aging_rate=1, B overtakes A at t=5:
+
+    >>> jobs = [{"pid": "A", "burst": 100, "priority": 1}, {"pid": "B", "burst": 1, "priority": 5}]
+    >>> list(priority_scheduling(jobs, aging_rate=1)[0])
+    [('A', 0.0, 5.0), ('B', 5.0, 6.0), ('A', 6.0, 101.0)]
+    """
+    aging_rate = float(aging_rate)
+    if aging_rate < 0:
+        raise ValueError("aging_rate must be non-negative")
+
+    proc_list = normalize_processes(processes)
     n = len(proc_list)
-    
-    # Static info for stats calculation later
-    arrival = {p["pid"]: p["arrival"] for p in proc_list}
-    original_burst = {p["pid"]: p["burst"] for p in proc_list}
-    priority = {p["pid"]: p["priority"] for p in proc_list}
-
-    # Dynamic tracking
-    remaining_time = {p["pid"]: p["burst"] for p in proc_list}
-    
-    schedule: List[Tuple[str, float, float]] = []
-    completion: Dict[str, float] = {}
-
-    current_time = 0.0
-    completed_count = 0
-    
-    while completed_count < n:
-        ready_queue = [
-            p for p in proc_list 
-            if p["arrival"] <= current_time and remaining_time[p["pid"]] > 0
-        ]
-
-        if not ready_queue:
-            # CPU is Idle
-            # Optimization: Jump to the next arrival time to save loop iterations
-            future_arrivals = [p["arrival"] for p in proc_list if p["arrival"] > current_time]
-            if future_arrivals:
-                next_event = min(future_arrivals)
-                schedule.append(("IDLE", current_time, next_event))
-                current_time = next_event
-            else:
-                break
-            continue
-
-        current_proc = min(ready_queue, key=lambda x: x["priority"])
-        pid = current_proc["pid"]
-
-        start_t = current_time
-        end_t = current_time + 1.0
-        
-        remaining_time[pid] -= 1.0
-        current_time += 1.0
-
-        if remaining_time[pid] <= 0:
-            diff = abs(remaining_time[pid]) 
-            end_t -= diff # Adjust end time if we overshot (e.g. burst was 0.5)
-            current_time -= diff # Correct global time
-            remaining_time[pid] = 0 # Clean up
-            
-            completed_count += 1
-            completion[pid] = current_time
-
-        if schedule and schedule[-1][0] == pid and abs(schedule[-1][2] - start_t) < 0.001:
-            last_pid, last_start, _ = schedule[-1]
-            schedule[-1] = (last_pid, last_start, end_t)
-        else:
-            schedule.append((pid, start_t, end_t))
-
-
-    stats: Dict[str, Any] = {}
-    total_tat = 0.0
-    total_wt = 0.0
-
-    for p in proc_list:
-        pid = p["pid"]
-        tat = float(completion[pid] - arrival[pid])
-        wt = float(tat - original_burst[pid]) # WT = TAT - Burst
 
-        stats[pid] = {
-            "arrival": arrival[pid],
-            "burst": original_burst[pid],
-            "priority": priority[pid],
-            "completion": completion[pid],
-            "turnaround": tat,
-            "waiting": wt
-        }
-
-        total_tat += tat
-        total_wt += wt
-
-    stats["avg_turnaround_time"] = float(total_tat / n) if n else 0.0
-    stats["avg_waiting_time"] = float(total_wt / n) if n else 0.0
+    if starvation_threshold is None:
+        starvation_threshold = 10 * sum(p["burst"] for p in proc_list) / n if n else 0.0
+    starvation_threshold = float(starvation_threshold)
+    max_wait: Dict[float, float] = {}
+    starved: Dict[float, int] = {}
+
+    def track_starvation(job, time: float) -> None:
+        wait = time - job.arrival - job.burst
+        cls = job.priority
+        if wait > max_wait.get(cls, float("-inf")):
+            max_wait[cls] = wait
+        starved[cls] = starved.get(cls, 0) + (wait > starvation_threshold)
+
+    schedule, stats = simulate(proc_list, Priority(aging_rate), switch_cost, cache_penalty,
+                               track_starvation, presorted=True)
+
+    stats.summary["max_waiting_time"] = max(max_wait.values(), default=0.0)
+    stats.summary["starved_processes"] = float(sum(starved.values()))
+    stats.summary["starvation_threshold"] = starvation_threshold
+    if len(max_wait) <= MAX_PRIORITY_CLASSES:
+        for cls in sorted(max_wait):
+            stats.summary[f"max_waiting_time_priority_{cls:g}"] = max_wait[cls]
+            stats.summary[f"starved_priority_{cls:g}"] = float(starved[cls])
 
     return schedule, stats
-
-
-def generate_priority_gantt(schedule: List[Tuple[str, float, float]], title="Preemptive Priority Gantt Chart") -> str:
-    pids = []
-    for pid, _, _ in schedule:
-        if pid != "IDLE" and pid not in pids:
-            pids.append(pid)
-    if any(seg[0] == "IDLE" for seg in schedule):
-        pids.append("IDLE")
-
-    y_pos = {pid: idx for idx, pid in enumerate(reversed(pids))}
-    cmap = plt.get_cmap("tab20")
-
-    fig, ax = plt.subplots(figsize=(10, max(2, 2 + len(pids) * 0.3)))
-
-    for idx, (pid, start, end) in enumerate(schedule):
-        color = "#cccccc" if pid == "IDLE" else cmap(idx % 20)
-
-        ax.barh(
-            y=y_pos[pid],
-            width=float(end - start),
-            left=float(start),
-            height=0.6,
-            color=color,
-            edgecolor="black"
-        )
-
-        mid = (start + end) / 2
-        if (end - start) >= 0.5:
-            ax.text(mid, y_pos[pid], pid, ha="center", va="center", fontsize=8)
-
-    ax.set_yticks(list(y_pos.values()))
-    ax.set_yticklabels(list(reversed(pids)))
-    ax.set_xlabel("Time")
-    ax.set_title(title)
-    ax.grid(axis="x", linestyle="--", alpha=0.3)
-
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format="png", dpi=150, bbox_inches="tight")
-    plt.close()
-    buffer.seek(0)
-
-    return base64.b64encode(buffer.getvalue()).decode("utf-8")
\ No newline at end of file
@@ -0,0 +1,160 @@
+from array import array
+from collections.abc import Mapping
+from typing import List, Dict, Tuple, Any, Iterator, Optional
+
+
+class Schedule:
+    """
+    Columnar Gantt schedule: one interned pid index plus float64 start/end per
+    segment (20 bytes a segment instead of a tuple and two float objects).
+
+    Iterating, indexing and len() behave like the old List[(pid, start, end)],
+    so chart code can consume either; to_list() builds the JSON shape.
+    """
+    __slots__ = ("pids", "_index", "pid_idx", "start", "end")
+
+    def __init__(self) -> None:
+        self.pids: List[Any] = []           # interned pid table
+        self._index: Dict[Any, int] = {}
+        self.pid_idx = array("i")
+        self.start = array("d")
+        self.end = array("d")
+
+    @classmethod
+    def from_columns(cls, pids: List[Any], pid_idx: Any, start: Any, end: Any) -> "Schedule":
+        """
+        Builds a schedule from a pid table and parallel columns. Columns may be
+        anything array() accepts, including raw bytes from NumPy's tobytes().
+        """
+        sched = cls()
+        sched.pids = list(pids)
+        sched._index = {pid: i for i, pid in enumerate(sched.pids)}
+        sched.pid_idx = array("i", pid_idx)
+        sched.start = array("d", start)
+        sched.end = array("d", end)
+        return sched
+
+    def intern(self, pid: Any) -> int:
+        idx = self._index.get(pid)
+        if idx is None:
+            idx = self._index[pid] = len(self.pids)
+            self.pids.append(pid)
+        return idx
+
+    def append(self, pid: Any, start: float, end: float) -> None:
+        self.pid_idx.append(self.intern(pid))
+        self.start.append(start)
+        self.end.append(end)
+
+    def last_pid(self) -> Optional[Any]:
+        return self.pids[self.pid_idx[-1]] if self.pid_idx else None
+
+    def extend_last(self, end: float) -> None:
+        """Stretches the final segment to end (used to merge contiguous runs)."""
+        self.end[-1] = end
+
+    def to_list(self) -> List[Tuple[Any, float, float]]:
+        return list(self)
+
+    def __len__(self) -> int:
+        return len(self.pid_idx)
+
+    def __iter__(self) -> Iterator[Tuple[Any, float, float]]:
+        pids = self.pids
+        for idx, s, e in zip(self.pid_idx, self.start, self.end):
+            yield (pids[idx], s, e)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(len(self)))]
+        return (self.pids[self.pid_idx[i]], self.start[i], self.end[i])
+
+    def __eq__(self, other) -> bool:
+        try:
+            return len(self) == len(other) and all(a == tuple(b) for a, b in zip(self, other))
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"Schedule({self.to_list()!r})"
+
+
+class Stats(Mapping):
+    """
+    Columnar per-process stats plus a summary dict of aggregates.
+
+    Reads like the old stats dict: stats[pid] gives the per-process dict and
+    stats["avg_waiting_time"] an aggregate. to_dict() builds the JSON shape.
+    """
+    __slots__ = ("pids", "arrival", "burst", "completion", "turnaround", "waiting",
+                 "extra", "summary", "_rows")
+
+    COLUMNS = ("arrival", "burst", "completion", "turnaround", "waiting")
+
+    def __init__(self, extra_columns: Tuple[str, ...] = ()) -> None:
+        self.pids: List[Any] = []
+        self.arrival = array("d")
+        self.burst = array("d")
+        self.completion = array("d")
+        self.turnaround = array("d")
+        self.waiting = array("d")
+        self.extra: Dict[str, array] = {name: array("d") for name in extra_columns}
+        self.summary: Dict[str, float] = {}
+        self._rows: Optional[Dict[Any, int]] = None   # pid -> row, built on first lookup
+
+    @classmethod
+    def from_columns(cls, pids: List[Any], arrival: Any, burst: Any, completion: Any,
+                     turnaround: Any, waiting: Any) -> "Stats":
+        stats = cls()
+        stats.pids = list(pids)
+        stats.arrival = array("d", arrival)
+        stats.burst = array("d", burst)
+        stats.completion = array("d", completion)
+        stats.turnaround = array("d", turnaround)
+        stats.waiting = array("d", waiting)
+        return stats
+
+    def add(self, pid: Any, arrival: float, burst: float, completion: float, **extra: float) -> None:
+        tat = float(completion - arrival)
+        self.pids.append(pid)
+        self.arrival.append(arrival)
+        self.burst.append(burst)
+        self.completion.append(completion)
+        self.turnaround.append(tat)
+        self.waiting.append(tat - burst)
+        for name, value in extra.items():
+            self.extra[name].append(value)
+        self._rows = None
+
+    def row(self, i: int) -> Dict[str, float]:
+        out = {"arrival": self.arrival[i], "burst": self.burst[i]}
+        for name, col in self.extra.items():
+            out[name] = col[i]
+        out["completion"] = self.completion[i]
+        out["turnaround"] = self.turnaround[i]
+        out["waiting"] = self.waiting[i]
+        return out
+
+    def to_dict(self) -> Dict[Any, Any]:
+        out: Dict[Any, Any] = {pid: self.row(i) for i, pid in enumerate(self.pids)}
+        out.update(self.summary)
+        return out
+
+    def __getitem__(self, key):
+        if key in self.summary:
+            return self.summary[key]
+        if self._rows is None:
+            self._rows = {pid: i for i, pid in enumerate(self.pids)}
+        return self.row(self._rows[key])
+
+    def __iter__(self):
+        yield from self.pids
+        yield from self.summary
+
+    def __len__(self) -> int:
+        return len(self.pids) + len(self.summary)
+
+    def __repr__(self) -> str:
+        return f"Stats({self.to_dict()!r})"
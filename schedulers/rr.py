@@ -1,109 +1,60 @@
-from collections import deque
-from typing import List, Dict, Tuple, Any
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
-import io, base64
-
-def round_robin(processes: List[Dict[str, Any]], quantum: float) -> Tuple[List[Tuple[str, float, float]], Dict[str, Any]]:
-    proc_list = [
-        {"pid": str(p.get("pid")), "arrival": float(p.get("arrival", 0)), "burst": float(p.get("burst", 0))}
-        for p in processes
-    ]
-    proc_list.sort(key=lambda x: x["arrival"])
-    n = len(proc_list)
-
-    rem = {p["pid"]: p["burst"] for p in proc_list}
-    arrival = {p["pid"]: p["arrival"] for p in proc_list}
-    burst = {p["pid"]: p["burst"] for p in proc_list}
-
-    schedule: List[Tuple[str, float, float]] = []
-    completion: Dict[str, float] = {}
-    q = deque()
-    time = 0.0
-    i = 0
-
-    # enqueue initial arrivals
-    while i < n and proc_list[i]["arrival"] <= time:
-        q.append(proc_list[i]["pid"])
-        i += 1
-
-    while q or i < n:
-        if not q:
-            next_arrival = proc_list[i]["arrival"]
-            schedule.append(("IDLE", time, next_arrival))
-            time = next_arrival
-            while i < n and proc_list[i]["arrival"] <= time:
-                q.append(proc_list[i]["pid"])
-                i += 1
-            continue
-
-        pid = q.popleft()
-        start = float(time)
-        exec_time = min(float(quantum), rem[pid])
-        end = start + exec_time
-        schedule.append((pid, start, end))
-        rem[pid] -= exec_time
-        time = end
-
-        while i < n and proc_list[i]["arrival"] <= time:
-            q.append(proc_list[i]["pid"])
-            i += 1
-
-        if rem[pid] > 0:
-            q.append(pid)
-        else:
-            completion[pid] = time
-
-    stats: Dict[str, Any] = {}
-    total_tat = total_wt = 0.0
-    for p in proc_list:
-        pid = p["pid"]
-        comp = completion.get(pid, 0.0)
-        tat = float(comp - arrival[pid])
-        wt = float(tat - burst[pid])
-        stats[pid] = {
-            "arrival": arrival[pid],
-            "burst": burst[pid],
-            "completion": comp,
-            "turnaround": tat,
-            "waiting": wt
-        }
-        total_tat += tat
-        total_wt += wt
-
-    stats["avg_turnaround_time"] = float(total_tat / n) if n else 0.0
-    stats["avg_waiting_time"] = float(total_wt / n) if n else 0.0
-
-    return schedule, stats
-
-def generate_gantt_image(schedule: List[Tuple[str, float, float]], title: str = "Round Robin Gantt Chart") -> str:
-    pids: List[str] = []
-    for pid, _, _ in schedule:
-        if pid != "IDLE" and pid not in pids:
-            pids.append(pid)
-    if any(seg[0] == "IDLE" for seg in schedule):
-        pids.append("IDLE")
-
-    y_pos = {pid: i for i, pid in enumerate(reversed(pids))}
-    cmap = plt.get_cmap("tab20")
-
-    fig, ax = plt.subplots(figsize=(10, max(2, 2 + len(pids) * 0.3)))
-    for idx, (pid, start, end) in enumerate(schedule):
-        color = "#cccccc" if pid == "IDLE" else cmap(idx % 20)
-        ax.barh(y=y_pos[pid], width=float(end - start), left=float(start), height=0.6, color=color, edgecolor="black")
-        mid = (start + end) / 2
-        if (end - start) >= 0.4:
-            ax.text(mid, y_pos[pid], pid, ha="center", va="center", fontsize=8)
-
-    ax.set_yticks(list(y_pos.values()))
-    ax.set_yticklabels(list(reversed(pids)))
-    ax.set_xlabel("Time")
-    ax.set_title(title)
-    ax.grid(axis="x", linestyle="--", alpha=0.3)
-
-    buf = io.BytesIO()
-    plt.savefig(buf, format="png", dpi=150, bbox_inches="tight")
-    plt.close()
-    buf.seek(0)
-    return base64.b64encode(buf.getvalue()).decode("utf-8")
+from typing import List, Dict, Tuple, Any, Callable, Iterable, Iterator, Optional
+
+from schedulers.gantt import generate_gantt_image  # re-exported for existing callers
+from schedulers.kernel import RoundRobin, normalize_processes, run, simulate
+from schedulers.metrics import RunningStats, SegmentMetrics
+from schedulers.result import Schedule, Stats
+
+def iter_round_robin(records: Iterable[Dict[str, Any]], quantum: float,
+                     on_complete: Optional[Callable[[str, float, float, float], None]] = None,
+                     switch_cost: float = 0.0, cache_penalty: float = 0.0) -> Iterator[Tuple[str, float, float]]:
+    """Streams Round Robin segments over arrival-ordered records; on_complete gets (pid, arrival, burst, completion)."""
+    def finished(job, time):
+        on_complete(job.pid, job.arrival, job.burst, time)
+
+    return run(records, RoundRobin(quantum), finished if on_complete is not None else None,
+               switch_cost, cache_penalty)
+
+
+def rr_sweep(processes: List[Dict[str, Any]], quanta: Iterable[float], presorted: bool = False,
+             switch_cost: float = 0.0, cache_penalty: float = 0.0) -> List[Dict[str, float]]:
+    """
+    Runs Round Robin once per quantum and returns one metrics dict each:
+    avg waiting/turnaround/response time, context switches, switch overhead
+    time, throughput and fairness. No schedule is kept. With presorted=True, processes must
+    already be normalized and sorted by arrival, so a sweep sorts them only
+    once.
+    """
+    proc_list = processes if presorted else normalize_processes(processes)
+    results = []
+    for quantum in quanta:
+        policy = RoundRobin(quantum)
+        running = RunningStats()
+        metrics = SegmentMetrics()
+
+        def record_completion(job, time):
+            running.record(job.arrival, job.burst, time)
+            metrics.complete(job.pid, job.arrival, time)
+
+        for pid, start, end in run(proc_list, policy, record_completion, switch_cost, cache_penalty):
+            metrics.observe(pid, start, end)
+
+        summary = running.summary()
+        dispatch = metrics.summary()
+        results.append({
+            "quantum": policy.quantum,
+            "avg_waiting_time": summary["avg_waiting_time"],
+            "avg_turnaround_time": summary["avg_turnaround_time"],
+            "avg_response_time": dispatch["avg_response_time"],
+            "p95_waiting_time": summary["p95_waiting_time"],
+            "context_switches": dispatch["context_switches"],
+            "switch_overhead_time": dispatch["switch_overhead_time"],
+            "throughput": dispatch["throughput"],
+            "fairness_index": summary["fairness_index"],
+        })
+    return results
+
+
+def round_robin(processes: List[Dict[str, Any]], quantum: float,
+                switch_cost: float = 0.0, cache_penalty: float = 0.0) -> Tuple[Schedule, Stats]:
+    return simulate(processes, RoundRobin(quantum), switch_cost, cache_penalty)
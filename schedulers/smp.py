@@ -0,0 +1,303 @@
+"""
+Multi-processor (SMP) simulation for every scheduling policy.
+
+N CPUs share either one global ready queue or one ready queue per CPU. With
+per-CPU queues, new work goes to the least-loaded CPU, and an idle CPU can
+steal from the longest queue. A process may carry an "affinity" CPU index as
+a soft hint: it is queued on that CPU, or preferred when that CPU is free.
+
+Ordering, preemption and aging come from the kernel policies, as do
+context switch costs, so one CPU reproduces the single-CPU schedulers.
+The engine is event-driven: a heap of per-CPU completion/slice-end events
+and the arrival-sorted process list. Each step is O(log n) plus an O(cpus)
+scan when a CPU has to be chosen or a preemptive policy is checked.
+"""
+from typing import List, Dict, Tuple, Any
+import heapq
+
+from schedulers.kernel import Job, POLICIES, make_policy, normalize_processes, switch_costs
+from schedulers.metrics import RunningStats, SegmentMetrics
+from schedulers.result import Schedule, Stats
+
+QUEUE_MODES = ("global", "per_cpu")
+
+_RUN, _SWITCH, _CHECK = 0, 1, 2
+
+
+def smp_schedule(processes: List[Dict[str, Any]], algorithm: str = "FCFS", cpus: int = 2,
+                 quantum: float = 2.0, queue: str = "global", steal: bool = True,
+                 aging_rate: float = 0.0, switch_cost: float = 0.0,
+                 cache_penalty: float = 0.0) -> Tuple[List[Schedule], Stats, List[float]]:
+    """
+    Simulates algorithm on cpus processors. Returns one Schedule per CPU,
+    per-process Stats (with the CPU each process finished on) and per-CPU
+    utilization over the makespan.
+    """
+    policy = make_policy(algorithm, quantum, aging_rate)
+    if queue not in QUEUE_MODES:
+        raise ValueError(f"queue must be one of {', '.join(QUEUE_MODES)}")
+    cpus = int(cpus)
+    if cpus < 1:
+        raise ValueError("cpus must be at least 1")
+    switch_cost, cache_penalty = switch_costs(switch_cost, cache_penalty)
+    inf = float("inf")
+    key, preempts, overtakes, rank = policy.key, policy.preempts, policy.overtakes, policy.rank
+    preemptive = policy.preemptive
+    ages = policy.aging_rate > 0
+    slice_len = policy.quantum if policy.quantum is not None else inf
+    per_cpu = queue == "per_cpu"
+
+    proc_list = normalize_processes(processes, keep=("affinity",))
+    n = len(proc_list)
+    jobs = [Job(p, j) for j, p in enumerate(proc_list)]
+    affinity = [None if p["affinity"] in (None, "") else int(p["affinity"]) % cpus for p in proc_list]
+    last_cpu = [-1] * n
+
+    schedules = [Schedule() for _ in range(cpus)]
+    stats = Stats(extra_columns=("cpu",))
+    running_stats = RunningStats()
+
+    # Per-CPU state; version invalidates the pending events of a preempted run
+    running = [-1] * cpus
+    keys: List[tuple] = [()] * cpus     # key each running process was dispatched with
+    seg_start = [0.0] * cpus            # after the context switch, if any
+    synced = [0.0] * cpus               # remaining is accounted up to here
+    finishes = [False] * cpus
+    version = [0] * cpus
+    loaded = [-1] * cpus
+    checked = [inf] * cpus              # pending aging check
+    free_since = [0.0] * cpus
+    metrics = [SegmentMetrics() for _ in range(cpus)]   # switches and busy time
+    is_idle = [True] * cpus
+    idle = list(range(cpus))    # lazy min-heap of idle CPUs
+    events: List[Tuple[float, int, int, int]] = []
+
+    # Ready queues hold (key, seq, position), keyed by the kernel policy
+    queues: List[List[Tuple[tuple, int, int]]] = [[] for _ in range(cpus if per_cpu else 1)]
+    queued = 0
+    seq = 0
+    migrations = 0
+    makespan = 0.0
+
+    def push(q: int, j: int, t: float) -> None:
+        nonlocal queued, seq
+        job = jobs[j]
+        job.ready_since = t
+        heapq.heappush(queues[q], (key(job, seq), seq, j))
+        seq += 1
+        queued += 1
+
+    def pop(q: int) -> Tuple[tuple, int]:
+        nonlocal queued
+        queued -= 1
+        k, _, j = heapq.heappop(queues[q])
+        return k, j
+
+    def has_idle() -> bool:
+        while idle and not is_idle[idle[0]]:
+            heapq.heappop(idle)
+        return bool(idle)
+
+    def start(c: int, j: int, k: tuple, t: float) -> None:
+        nonlocal migrations
+        job = jobs[j]
+        if t > free_since[c]:
+            schedules[c].append("IDLE", free_since[c], t)
+        if last_cpu[j] not in (-1, c):
+            migrations += 1
+        last_cpu[j] = c
+        running[c] = j
+        keys[c] = k
+        is_idle[c] = False
+        checked[c] = inf
+        version[c] += 1
+        job.waited += t - job.ready_since
+        job.ready_since = seg_start[c] = synced[c] = t
+        if loaded[c] != j:
+            loaded[c] = j
+            cost = switch_cost + (cache_penalty if job.remaining < job.burst else 0.0)
+            if cost > 0:
+                schedules[c].append("CS", t, t + cost)
+                metrics[c].observe("CS", t, t + cost)
+                # as in the kernel, the incoming process ages through its switch
+                job.waited += cost
+                job.ready_since = seg_start[c] = synced[c] = t + cost
+                # the run is timed once the switch ends and preemption is settled
+                heapq.heappush(events, (t + cost, _SWITCH, c, version[c]))
+                return
+        begin(c, t)
+
+    def begin(c: int, t: float) -> None:
+        job = jobs[running[c]]
+        finishes[c] = job.remaining <= slice_len
+        length = job.remaining if finishes[c] else slice_len
+        heapq.heappush(events, (t + length, _RUN, c, version[c]))
+
+    def sync(c: int, t: float) -> None:
+        jobs[running[c]].remaining -= t - synced[c]
+        synced[c] = t
+
+    def stop(c: int, t: float, ran: bool = False) -> int:
+        # ran: the run ended on its own, so it counts even at zero length
+        j = running[c]
+        s = seg_start[c]
+        if t > s or ran:
+            metrics[c].observe(jobs[j].pid, s, t)
+        if t > s:
+            sched = schedules[c]
+            if sched.last_pid() == jobs[j].pid and sched.end[-1] == s:
+                sched.extend_last(t)
+            else:
+                sched.append(jobs[j].pid, s, t)
+        if ran and not finishes[c]:
+            jobs[j].remaining -= slice_len    # a whole slice, counted as the kernel does
+        else:
+            sync(c, t)
+        running[c] = -1
+        version[c] += 1
+        free_since[c] = t
+        return j
+
+    def release(c: int) -> None:
+        is_idle[c] = True
+        heapq.heappush(idle, c)
+
+    def load(c: int) -> int:
+        return len(queues[c]) + (running[c] >= 0)
+
+    def place(j: int, t: float) -> int:
+        if not per_cpu:
+            q = 0
+        elif affinity[j] is not None:
+            q = affinity[j]
+        else:
+            q = min(range(cpus), key=load)
+        push(q, j, t)
+        return q
+
+    def switched_in(c: int, t: float) -> bool:
+        # a context switch is not interruptible
+        return running[c] >= 0 and seg_start[c] <= t
+
+    def preempt(c: int, q: int, t: float) -> None:
+        push(q, stop(c, t), t)
+        k, j = pop(q)
+        start(c, j, k, t)
+
+    def dispatch(t: float) -> None:
+        if not per_cpu:
+            q = queues[0]
+            while q and has_idle():
+                k, j = pop(0)
+                c = affinity[j]
+                if c is None or not is_idle[c]:
+                    c = heapq.heappop(idle)
+                start(c, j, k, t)
+            return
+        if not queued or not has_idle():
+            return
+        for c in sorted(set(idle)):
+            if not is_idle[c]:
+                continue
+            q = c
+            if not queues[q] and steal:
+                q = max(range(cpus), key=lambda v: len(queues[v]))
+            if queues[q]:
+                k, j = pop(q)
+                start(c, j, k, t)
+            if not queued:
+                break
+
+    pos = 0
+    while pos < n or events:
+        t = events[0][0] if events else inf
+        if pos < n and jobs[pos].arrival < t:
+            t = jobs[pos].arrival
+
+        # Completions and slice ends at t come before arrivals at t; checks
+        # (a switch ending, a queued process aging past) come last
+        expired = []
+        switched = []
+        check = set()
+        while events and events[0][0] <= t:
+            _, kind, c, ver = heapq.heappop(events)
+            if ver != version[c]:
+                continue
+            if kind == _SWITCH:
+                switched.append((c, ver))
+            elif kind == _CHECK:
+                checked[c] = inf
+            if kind != _RUN:
+                check.add(c)
+                continue
+            done = finishes[c]
+            j = stop(c, t, True)
+            release(c)
+            if done:
+                job = jobs[j]
+                job.remaining = 0.0
+                stats.add(job.pid, job.arrival, job.burst, t, cpu=c)
+                running_stats.record(job.arrival, job.burst, t)
+                makespan = t
+            else:
+                expired.append((c, j))
+
+        while pos < n and jobs[pos].arrival <= t:
+            check.add(place(pos, t))
+            pos += 1
+
+        # Round robin: a sliced process rejoins behind the new arrivals
+        for c, j in expired:
+            push(c if per_cpu else 0, j, t)
+
+        dispatch(t)
+
+        if preemptive and check:
+            if per_cpu:
+                for c in sorted(check):
+                    if queues[c] and switched_in(c, t):
+                        sync(c, t)
+                        if preempts(queues[c][0][0], jobs[running[c]], keys[c], t):
+                            preempt(c, c, t)
+            else:
+                q = queues[0]
+                while q and not has_idle():
+                    live = [c for c in range(cpus) if switched_in(c, t)]
+                    if not live:
+                        break
+                    for c in live:
+                        sync(c, t)
+                    c = max(live, key=lambda v: rank(jobs[running[v]], keys[v], t))
+                    if not preempts(q[0][0], jobs[running[c]], keys[c], t):
+                        break
+                    preempt(c, 0, t)
+
+        # A switch that was not preempted as it ended starts its run
+        for c, ver in switched:
+            if ver == version[c]:
+                begin(c, t)
+
+        if not ages:
+            continue
+        # With aging, the head of a queue can overtake a running process
+        # without any event; schedule a check for when it does
+        for c in range(cpus):
+            q = queues[c if per_cpu else 0]
+            if running[c] >= 0 and q:
+                tx = overtakes(q[0][0], jobs[running[c]], keys[c])
+                if t < tx < checked[c]:
+                    checked[c] = tx
+                    heapq.heappush(events, (tx, _CHECK, c, version[c]))
+
+    utilization = [m.busy / makespan if makespan > 0 else 0.0 for m in metrics]
+    stats.summary.update(running_stats.summary())
+    stats.summary.update({
+        "cpus": float(cpus),
+        "makespan": makespan,
+        "avg_cpu_utilization": sum(utilization) / cpus,
+        "migrations": float(migrations),
+        "context_switches": float(sum(m.switches for m in metrics)),
+        "switch_overhead_time": sum(m.overhead for m in metrics),
+    })
+
+    return schedules, stats, utilization
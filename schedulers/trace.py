@@ -0,0 +1,175 @@
+"""
+Streaming trace ingestion for offline simulation.
+
+Reads process records from CSV or JSONL files (optionally gzip-compressed)
+one line at a time and feeds them, in arrival order, to the event-driven
+kernel (schedulers.kernel), so multi-GB traces replay with bounded memory.
+
+Usage:
+    python -m schedulers.trace TRACE [--algorithm fcfs|sjf|srtf|priority|rr]
+                               [--quantum Q] [--segments OUT.csv]
+"""
+import argparse
+import csv
+import gzip
+import io
+import json
+import sys
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from schedulers.metrics import RunningStats
+
+REPLAY_ALGORITHMS = ("fcfs", "sjf", "srtf", "priority", "rr")
+
+
+def _open_text(path: str) -> io.TextIOBase:
+    if path == "-":
+        return sys.stdin
+    with open(path, "rb") as f:
+        magic = f.read(2)
+    if magic == b"\x1f\x8b":
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, "r", encoding="utf-8", newline="")
+
+
+def _detect_format(path: str) -> str:
+    name = path[:-3] if path.endswith(".gz") else path
+    if name.endswith((".jsonl", ".ndjson", ".json")):
+        return "jsonl"
+    return "csv"
+
+
+def _normalize(record: Dict[str, Any]) -> Dict[str, Any]:
+    out = {
+        "pid": str(record.get("pid")),
+        "arrival": float(record.get("arrival") or 0),
+        "burst": float(record.get("burst") or 0),
+    }
+    if record.get("priority") not in (None, ""):
+        out["priority"] = float(record["priority"])
+    return out
+
+
+def read_trace(path: str, fmt: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Yields normalized {"pid", "arrival", "burst"[, "priority"]} records from a
+    CSV (header row required) or JSONL trace without loading the whole file.
+    fmt is "csv" or "jsonl"; by default it is taken from the file extension.
+    """
+    fmt = fmt or _detect_format(path)
+    f = _open_text(path)
+    try:
+        if fmt == "csv":
+            for row in csv.DictReader(f):
+                yield _normalize(row)
+        elif fmt == "jsonl":
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield _normalize(json.loads(line))
+        else:
+            raise ValueError(f"Unknown trace format: {fmt}")
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+class ArrivalCursor:
+    """
+    One-record lookahead over an arrival-ordered stream of process records.
+    Raises ValueError if arrivals go backwards, since a stream cannot be
+    re-sorted without buffering it.
+    """
+    __slots__ = ("_it", "_next", "_last", "_count")
+
+    def __init__(self, records: Iterable[Dict[str, Any]]) -> None:
+        self._it = iter(records)
+        self._last = float("-inf")
+        self._count = 0
+        self._advance()
+
+    def _advance(self) -> None:
+        self._next = next(self._it, None)
+        if self._next is not None:
+            self._count += 1
+            arrival = self._next["arrival"]
+            if arrival < self._last:
+                raise ValueError(
+                    f"Trace record {self._count} arrives at {arrival} after {self._last}; "
+                    "traces must be sorted by arrival"
+                )
+            self._last = arrival
+
+    def __bool__(self) -> bool:
+        return self._next is not None
+
+    def peek_arrival(self) -> float:
+        return self._next["arrival"]
+
+    def pop(self) -> Dict[str, Any]:
+        record = self._next
+        self._advance()
+        return record
+
+
+def replay(records: Iterable[Dict[str, Any]], algorithm: str = "fcfs", quantum: float = 2.0,
+           segments_out: Optional[io.TextIOBase] = None) -> Dict[str, float]:
+    """
+    Runs one streaming scheduler over records and returns aggregate stats,
+    including tail percentiles. Only running sums and quantile sketches are
+    kept, so memory is bounded by the ready queue.
+    """
+    from schedulers import kernel
+
+    if algorithm not in REPLAY_ALGORITHMS:
+        raise ValueError(f"Streaming replay supports {', '.join(REPLAY_ALGORITHMS)}, not {algorithm}")
+    policy = kernel.make_policy(algorithm, quantum)
+
+    running = RunningStats()
+
+    def on_complete(job, completion):
+        running.record(job.arrival, job.burst, completion)
+
+    segments = kernel.run(records, policy, on_complete)
+
+    writer = csv.writer(segments_out) if segments_out is not None else None
+    if writer:
+        writer.writerow(["pid", "start", "end"])
+
+    count = 0
+    makespan = 0.0
+    for pid, start, end in segments:
+        count += 1
+        makespan = end
+        if writer:
+            writer.writerow([pid, start, end])
+
+    return {
+        "algorithm": algorithm,
+        "processes": running.count,
+        "segments": count,
+        "makespan": makespan,
+        **running.summary(),
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Replay a process trace through a scheduler.")
+    parser.add_argument("trace", help="CSV or JSONL trace, optionally .gz; '-' reads stdin")
+    parser.add_argument("--format", choices=("csv", "jsonl"), help="override format detection")
+    parser.add_argument("--algorithm", choices=REPLAY_ALGORITHMS, default="fcfs")
+    parser.add_argument("--quantum", type=float, default=2.0, help="round robin time quantum")
+    parser.add_argument("--segments", help="write the Gantt segments to this CSV file")
+    args = parser.parse_args(argv)
+
+    out = open(args.segments, "w", newline="") if args.segments else None
+    try:
+        summary = replay(read_trace(args.trace, args.format), args.algorithm, args.quantum, out)
+    finally:
+        if out:
+            out.close()
+    print(json.dumps(summary))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+from typing import List, Dict, Tuple, Any, Sequence
+import heapq
+import numpy as np
+
+from schedulers.metrics import RunningStats, dispatch_summary
+from schedulers.result import Schedule, Stats
+
+
+def fcfs_arrays(arrival: Sequence[float], burst: Sequence[float],
+                switch_cost: float = 0.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized First Come First Serve over parallel float64 columns.
+
+    Completion times are a running max/sum over the arrival-sorted columns:
+        C[k] = S[k] + max(0, max_{j<=k}(A[j] - S[j-1]))
+    where S is the cumulative burst plus switch_cost per dispatch, so the
+    whole run is O(n log n) for the sort plus a handful of O(n) NumPy
+    passes. Times agree with sequential addition only up to float rounding;
+    the dispatch order is the arrival order either way.
+
+    Returns:
+        order: input index of each process in dispatch order
+        start, completion: float64 arrays aligned with order
+    """
+    arrival = np.asarray(arrival, dtype=np.float64)
+    burst = np.asarray(burst, dtype=np.float64)
+
+    order = np.argsort(arrival, kind="stable")
+    a = arrival[order]
+    b = burst[order] + switch_cost
+
+    csum = np.cumsum(b)
+    offset = np.maximum.accumulate(np.maximum(a - (csum - b), 0.0)) if len(a) else a
+    completion = csum + offset
+
+    # A process starts either right as the previous one ends or, after an
+    # idle gap, exactly at its arrival. The cumulative sums round differently
+    # from sequential addition, so gaps within float noise are not idle time.
+    prev_end = np.concatenate(([0.0], completion[:-1])) if len(a) else a
+    idle = a - prev_end > 1e-9 * np.maximum(1.0, np.abs(a))
+    start = np.where(idle, a, prev_end)
+
+    return order, start, completion
+
+
+def sjf_arrays(arrival: Sequence[float], burst: Sequence[float],
+               switch_cost: float = 0.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Non-preemptive Shortest Job First over parallel float64 columns.
+
+    Dispatch order is inherently sequential, so it is chosen with a heap keyed
+    on (burst, arrival position); everything around it is array based. Each
+    dispatch takes switch_cost and then the burst, added one after the other
+    as schedulers.kernel does, so ties against arrivals resolve the same way.
+    Same return layout as fcfs_arrays.
+    """
+    arrival = np.asarray(arrival, dtype=np.float64)
+    burst = np.asarray(burst, dtype=np.float64)
+
+    by_arrival = np.argsort(arrival, kind="stable")
+    a = arrival[by_arrival].tolist()
+    b = burst[by_arrival].tolist()
+    n = len(a)
+
+    picked = np.empty(n, dtype=np.int64)
+    start = np.empty(n, dtype=np.float64)
+    ready: List[Tuple[float, int]] = []
+    time = 0.0
+    i = 0
+
+    for k in range(n):
+        if not ready and time < a[i]:
+            time = a[i]
+        while i < n and a[i] <= time:
+            heapq.heappush(ready, (b[i], i))
+            i += 1
+
+        bt, pos = heapq.heappop(ready)
+        picked[k] = pos
+        start[k] = time
+        time = time + switch_cost + bt
+
+    order = by_arrival[picked]
+    completion = start + switch_cost + burst[order]
+
+    return order, start, completion
+
+
+def build_result(pids: List[Any], arrival: np.ndarray, burst: np.ndarray, order: np.ndarray,
+                 start: np.ndarray, completion: np.ndarray, switch_cost: float = 0.0) -> Tuple[Schedule, Stats]:
+    """
+    Converts dispatch-ordered arrays into the columnar (Schedule, Stats) pair
+    shared by all schedulers, inserting IDLE segments wherever the CPU waited.
+    With switch_cost > 0 each dispatch starts with a "CS" segment of that
+    length (the engine must have been run with the same switch_cost).
+    """
+    n = len(order)
+    a = arrival[order]
+    b = burst[order]
+
+    prev_end = np.concatenate(([0.0], completion[:-1])) if n else completion
+    idle = start > prev_end
+
+    tat = completion - a
+    wt = tat - b
+
+    # Intern pids: one small int per process instead of a pid per segment
+    table: List[Any] = []
+    index: Dict[Any, int] = {}
+    dispatched = [pids[k] for k in order.tolist()]
+    proc_idx = np.empty(n, dtype=np.intc)
+    for k, pid in enumerate(dispatched):
+        idx = index.get(pid)
+        if idx is None:
+            idx = index[pid] = len(table)
+            table.append(pid)
+        proc_idx[k] = idx
+
+    # Each context switch goes right before the process it loads, and each
+    # IDLE gap right before that
+    cs = 1 if switch_cost > 0 else 0
+    pos = np.arange(n) * (1 + cs) + cs + np.cumsum(idle)
+    total = n * (1 + cs) + int(idle.sum())
+    seg_pid = np.empty(total, dtype=np.intc)
+    seg_start = np.empty(total, dtype=np.float64)
+    seg_end = np.empty(total, dtype=np.float64)
+    seg_pid[pos] = proc_idx
+    seg_start[pos] = start + switch_cost
+    seg_end[pos] = completion
+    if cs:
+        table.append("CS")
+        seg_pid[pos - 1] = len(table) - 1
+        seg_start[pos - 1] = start
+        seg_end[pos - 1] = start + switch_cost
+    if idle.any():
+        table.append("IDLE")
+        gap = pos[idle] - 1 - cs
+        seg_pid[gap] = len(table) - 1
+        seg_start[gap] = prev_end[idle]
+        seg_end[gap] = start[idle]
+
+    schedule = Schedule.from_columns(table, seg_pid.tobytes(), seg_start.tobytes(), seg_end.tobytes())
+    stats = Stats.from_columns(dispatched, a.tobytes(), b.tobytes(), completion.tobytes(),
+                               tat.tobytes(), wt.tobytes())
+
+    running = RunningStats()
+    running.record_arrays(tat, wt)
+    stats.summary.update(running.summary())
+    # Non-preemptive: one dispatch, hence one switch, per process, and each
+    # process first runs right after its switch
+    stats.summary.update(dispatch_summary(
+        n, n, n * float(switch_cost), float(b.sum()),
+        float(completion.max()) if n else 0.0, float((start - a).sum()) + n * float(switch_cost)))
+
+    return schedule, stats